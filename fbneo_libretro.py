@@ -1,22 +1,50 @@
 import sys
 import os
+import argparse
+import getpass
 import subprocess
 import json
+import math
+import re
 import time
+import heapq
+import bisect
+import queue
+import threading
+import tracemalloc
+import gzip
+import mmap
+import zipfile
+import shutil
+import tempfile
+import multiprocessing
+import sqlite3
+import hashlib
+from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
 import xml.etree.ElementTree as ET
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QLineEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
+    QListWidget, QListWidgetItem, QLineEdit, QPushButton, QLabel, QFileDialog, QMessageBox,
     QDialog, QFormLayout, QComboBox, QGroupBox, QScrollArea, QSizePolicy,
-    QTabWidget, QSplitter, QCheckBox, QMenu
+    QTabWidget, QSplitter, QCheckBox, QMenu, QCompleter, QListView, QProgressBar, QPlainTextEdit
 )
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QIcon, QPixmap, QContextMenuEvent
+from PyQt5.QtCore import QTimer, Qt, QBuffer, QIODevice, QSize
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QContextMenuEvent, QStandardItemModel, QStandardItem
 
 import pygame
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 TAB_CONFIGS = [
     {"name": "Arcade", "rom_titles_file": "rom_titles_arcade.txt"},
     {"name": "CBS ColecoVision", "rom_titles_file": "rom_titles_coleco.txt"},
@@ -38,6 +66,21 @@ TAB_CONFIGS = [
 ]
 
 CONFIG_FILE = Path("config.json")
+THUMBNAIL_PACK = Path("thumbnails.pack")
+THUMBNAIL_INDEX = Path("thumbnails.idx")
+THUMBNAIL_SIZE = (640, 480)
+HISTORY_DB = Path("history.db")
+METADATA_INDEX_DIR = Path("metadata_index")
+RESIDENT_SERVER_NAME = "fbneo_libretro_launcher"
+LAUNCHER_VALIDATION_CACHE = set()
+ROM_CACHE_LOCK = threading.RLock()
+DIR_LISTINGS = {}
+IMAGE_ARCHIVES = {}
+IMAGE_ARCHIVES_LOCK = threading.Lock()
+METADATA_INDEXES = {}
+METADATA_INDEXES_LOCK = threading.Lock()
+METADATA_INDEXES_PENDING = set()
+METADATA_INDEXES_FAILED = {}
 DEFAULT_CONFIG = {
     "RETROARCH": "",
     "RETROARCH_CORE": "",
@@ -45,18 +88,36 @@ DEFAULT_CONFIG = {
     "xml_dat_files": {config["name"]: "" for config in TAB_CONFIGS},
     "title_image_dirs": {config["name"]: "" for config in TAB_CONFIGS},
     "preview_image_dirs": {config["name"]: "" for config in TAB_CONFIGS},
+    "history_files": {config["name"]: "" for config in TAB_CONFIGS},
+    "category_files": {config["name"]: "" for config in TAB_CONFIGS},
     "joystick_config": {
         "hat_scroll_cooldown": 0.08,
         "hat_fastest_steps": 10,
         "hat_fastest_delay": 0.02,
+        "image_settle_delay": 0.15,
         "button_up": 2,
         "button_down": 3,
         "button_select": 0,
         "button_favorites": 7,
         "button_prev_tab": 4,
-        "button_next_tab": 5
+        "button_next_tab": 5,
+        "button_toggle_clones": -1,
+        "button_prev_letter": -1,
+        "button_next_letter": -1,
+        "button_history": -1
     },
     "display_only_rom_list": False,
+    "group_clones": False,
+    "thumbnail_cache": True,
+    "grid_view": False,
+    "resident_mode": False,
+    "memory_budget_mb": 256,
+    "readahead_mb": 256,
+    "favorites_in_database": False,
+    "api_server": False,
+    "api_host": "127.0.0.1",
+    "api_port": 8780,
+    "video_snaps": True,
     "favorites": []
 }
 
@@ -67,12 +128,39 @@ def load_config():
         jc = cfg.get("joystick_config", {})
         jc.setdefault("hat_fastest_steps", 10)
         jc.setdefault("hat_fastest_delay", 0.02)
+        jc.setdefault("button_toggle_clones", -1)
+        jc.setdefault("image_settle_delay", 0.15)
+        jc.setdefault("button_prev_letter", -1)
+        jc.setdefault("button_next_letter", -1)
+        jc.setdefault("button_history", -1)
         cfg["joystick_config"] = jc
-        for k in ["xml_dat_files", "title_image_dirs", "preview_image_dirs"]:
+        for k in ["xml_dat_files", "title_image_dirs", "preview_image_dirs", "history_files", "category_files"]:
             if k not in cfg:
                 cfg[k] = {config["name"]: "" for config in TAB_CONFIGS}
         if "display_only_rom_list" not in cfg:
             cfg["display_only_rom_list"] = False
+        if "group_clones" not in cfg:
+            cfg["group_clones"] = False
+        if "thumbnail_cache" not in cfg:
+            cfg["thumbnail_cache"] = True
+        if "grid_view" not in cfg:
+            cfg["grid_view"] = False
+        if "resident_mode" not in cfg:
+            cfg["resident_mode"] = False
+        if "memory_budget_mb" not in cfg:
+            cfg["memory_budget_mb"] = 256
+        if "readahead_mb" not in cfg:
+            cfg["readahead_mb"] = 256
+        if "favorites_in_database" not in cfg:
+            cfg["favorites_in_database"] = False
+        if "api_server" not in cfg:
+            cfg["api_server"] = False
+        if "api_host" not in cfg:
+            cfg["api_host"] = "127.0.0.1"
+        if "api_port" not in cfg:
+            cfg["api_port"] = 8780
+        if "video_snaps" not in cfg:
+            cfg["video_snaps"] = True
         if "favorites" not in cfg:
             cfg["favorites"] = []
         return cfg
@@ -84,6 +172,40 @@ def save_config(cfg):
     with open(CONFIG_FILE, "w", encoding="utf-8") as f:
         json.dump(cfg, f, indent=4)
 
+def parse_launcher_args(argv):
+    parser = argparse.ArgumentParser(description="FinalBurn Neo [Libretro] game launcher")
+    parser.add_argument("--system", help='system to select, e.g. "Arcade"')
+    parser.add_argument("--quit", action="store_true", help="quit the resident instance")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+def resident_server_name():
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ""
+    return f"{RESIDENT_SERVER_NAME}-{user}" if user else RESIDENT_SERVER_NAME
+
+def forward_to_resident_instance(argv, timeout_ms=500):
+    """Hand argv to an already running resident instance; returns True if one took it."""
+    socket = QLocalSocket()
+    socket.connectToServer(resident_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((json.dumps(argv) + "\n").encode("utf-8"))
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return True
+
+def resident_instance_running(timeout_ms=500):
+    """True if a live instance answers on the resident socket, i.e. the name is not just stale."""
+    socket = QLocalSocket()
+    socket.connectToServer(resident_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.disconnectFromServer()
+    return True
+
 def load_rom_titles(filename: str):
     rom_titles = {}
     if not os.path.exists(filename):
@@ -99,34 +221,96 @@ def load_rom_titles(filename: str):
                 rom_titles[key] = title
     return rom_titles
 
+def find_7z_executable():
+    for name in ("7z", "7za", "7zr"):
+        path = shutil.which(name)
+        if path:
+            return path
+    for path in (r"C:\Program Files\7-Zip\7z.exe", r"C:\Program Files (x86)\7-Zip\7z.exe"):
+        if os.path.exists(path):
+            return path
+    return None
+
+@contextmanager
+def open_dat_stream(xml_path):
+    """
+    Open a DAT as a binary stream, decompressing .gz/.zip/.7z on the fly without extracting
+    to disk. Zip archives use their first .dat/.xml member; .7z needs the 7-Zip command line
+    tool, whose output is piped straight into the parser.
+    """
+    lower = xml_path.lower()
+    if lower.endswith(".gz"):
+        with gzip.open(xml_path, "rb") as f:
+            yield f
+    elif lower.endswith(".zip"):
+        with zipfile.ZipFile(xml_path) as archive:
+            names = archive.namelist()
+            names = [n for n in names if n.lower().endswith((".dat", ".xml"))] or names
+            if not names:
+                raise ValueError("empty zip archive")
+            with archive.open(names[0]) as f:
+                yield f
+    elif lower.endswith(".7z"):
+        exe = find_7z_executable()
+        if exe is None:
+            raise RuntimeError("7-Zip (7z) is required to read .7z DAT files")
+        proc = subprocess.Popen([exe, "e", "-so", xml_path], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+    else:
+        with open(xml_path, "rb") as f:
+            yield f
+
 def parse_dat_metadata(xml_path):
     """
-    Parse the XML/DAT file and return a meta dictionary excluding <game isbios="yes"> entries.
-    Each entry maps rom name -> (title, year, manufacturer).
+    Parse the XML/DAT file (optionally .gz/.zip/.7z compressed) and return a meta dictionary
+    excluding <game isbios="yes"> entries. Each entry maps rom name -> (title, year,
+    manufacturer, parent), where parent is the lowercased cloneof/romof set name, or "" for
+    parent sets. Entries are parsed incrementally and dropped from the root once read, so
+    the whole document is never held in memory.
     """
     meta = {}
     if not xml_path or not os.path.exists(xml_path):
         return meta
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        for entry in root.findall(".//game") + root.findall(".//machine"):
-            if entry.attrib.get("isbios", "no") == "yes":
-                continue
-            name = entry.attrib.get("name") or entry.attrib.get("romname") or ""
-            title_node = entry.find("description")
-            year_node = entry.find("year")
-            manuf_node = entry.find("manufacturer")
-            title = title_node.text.strip() if title_node is not None and title_node.text else name
-            year = year_node.text.strip() if year_node is not None and year_node.text else ""
-            manuf = manuf_node.text.strip() if manuf_node is not None and manuf_node.text else ""
-            if name:
-                meta[name.lower()] = (title, year, manuf)
+        with open_dat_stream(xml_path) as stream:
+            root = None
+            for event, entry in ET.iterparse(stream, events=("start", "end")):
+                if root is None:
+                    root = entry
+                if event != "end" or entry.tag not in ("game", "machine"):
+                    continue
+                parse_dat_entry(entry, meta)
+                # Clearing the entry alone leaves an empty element per game under the root
+                root.clear()
     except Exception as e:
         print(f"Failed to parse {xml_path}: {e}")
+    # romof also points at BIOS sets (e.g. neogeo), which are not games themselves
+    for name, (title, year, manuf, parent) in meta.items():
+        if parent and parent not in meta:
+            meta[name] = (title, year, manuf, "")
     return meta
 
-def auto_create_rom_titles(roms_dir, xml_path, system_name, rom_titles_file):
+def parse_dat_entry(entry, meta):
+    if entry.attrib.get("isbios", "no") == "yes":
+        return
+    name = entry.attrib.get("name") or entry.attrib.get("romname") or ""
+    title_node = entry.find("description")
+    year_node = entry.find("year")
+    manuf_node = entry.find("manufacturer")
+    title = title_node.text.strip() if title_node is not None and title_node.text else name
+    year = year_node.text.strip() if year_node is not None and year_node.text else ""
+    manuf = manuf_node.text.strip() if manuf_node is not None and manuf_node.text else ""
+    parent = entry.attrib.get("cloneof") or entry.attrib.get("romof") or ""
+    if name:
+        meta[name.lower()] = (title, year, manuf, parent.lower())
+
+def scan_rom_dir(roms_dir, system_name):
     roms = []
     if system_name == "SNK Neo-Geo CD":
         for root, _, files in os.walk(roms_dir):
@@ -139,23 +323,44 @@ def auto_create_rom_titles(roms_dir, xml_path, system_name, rom_titles_file):
             f for f in os.listdir(roms_dir)
             if os.path.isfile(os.path.join(roms_dir, f)) and f.lower().endswith(('.zip', '.7z', '.cue'))
         ]
+    return roms
+
+def auto_create_rom_titles(roms_dir, xml_path, system_name, rom_titles_file):
+    roms = scan_rom_dir(roms_dir, system_name)
     rom_bases = [Path(f).stem for f in roms]
     rom_bases_lower = [base.lower() for base in rom_bases]
     meta = parse_dat_metadata(xml_path) if xml_path else {}
     lines = []
     for rom, base, base_lower in zip(roms, rom_bases, rom_bases_lower):
         if base_lower in meta:
-            title, year, manuf = meta[base_lower]
+            title, year, manuf = meta[base_lower][:3]
             lines.append(f"{base} \"{title}\" \"{year}\" \"{manuf}\"")
         else:
             lines.append(f"{base} \"{base}\"")
     try:
-        with open(rom_titles_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-        return True, len(lines)
+        changed = write_file_if_changed(rom_titles_file, "\n".join(lines))
+        return True, len(lines), changed
     except Exception as e:
-        return False, str(e)
-        
+        return False, str(e), False
+
+def write_file_if_changed(path, content):
+    """
+    Write content only when it differs from the file, keeping its mtime (and every cache
+    fingerprinted on it) valid otherwise. The write goes through a temp file, so an
+    interrupted writer never leaves a truncated file. Returns True if the file was written.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
 ROM_HIDE_LIST = {"neocdz", "rom_to_hide2"}
 
 def find_file_case_insensitive(directory, filename):
@@ -166,28 +371,150 @@ def find_file_case_insensitive(directory, filename):
             return os.path.join(directory, f)
     return None
 
-def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
-    cache_key = (roms_dir, system_name, xml_dat_file)
-    cache = cache_dict.get(cache_key)
-    if cache is not None:
-        return cache
-    rom_titles = load_rom_titles(rom_titles_file)
-    meta = parse_dat_metadata(xml_dat_file) if xml_dat_file else {}
-    if not roms_dir or not os.path.exists(roms_dir):
-        cache_dict[cache_key] = []
-        return []
-    roms = []
-    if system_name == "SNK Neo-Geo CD":
-        for root, _, files in os.walk(roms_dir):
-            for f in files:
-                if f.lower().endswith('.cue'):
-                    rel_path = os.path.relpath(os.path.join(root, f), roms_dir)
-                    roms.append(rel_path)
-    else:
-        roms = [
-            f for f in os.listdir(roms_dir)
-            if os.path.isfile(os.path.join(roms_dir, f)) and f.lower().endswith(('.zip', '.7z', '.cue'))
-        ]
+def file_fingerprint(path):
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+def find_file_cached(directory, filename):
+    """
+    Like find_file_case_insensitive, but tries the exact name first and keeps one lowercased
+    listing per folder until the folder's mtime changes, so misses do not relist network folders.
+    """
+    if not directory:
+        return None
+    path = os.path.join(directory, filename)
+    if os.path.isfile(path):
+        return path
+    fingerprint = file_fingerprint(directory)
+    cached = DIR_LISTINGS.get(directory)
+    if cached is None or cached[0] != fingerprint:
+        try:
+            cached = (fingerprint, {f.lower(): f for f in os.listdir(directory)})
+        except OSError:
+            return None
+        DIR_LISTINGS[directory] = cached
+    name = cached[1].get(filename.lower())
+    return os.path.join(directory, name) if name else None
+
+def is_image_archive(image_dir):
+    return bool(image_dir) and image_dir.lower().endswith(".zip") and os.path.isfile(image_dir)
+
+def get_image_archive(path):
+    """
+    Return (zip file, lowercased member name -> ZipInfo) for an artwork archive, or None.
+    The central directory is only read again when the archive's size or mtime changes;
+    members in subfolders are found by their base name.
+    """
+    fingerprint = file_fingerprint(path)
+    with IMAGE_ARCHIVES_LOCK:
+        cached = IMAGE_ARCHIVES.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        if cached is not None:
+            cached[1][0].close()
+            del IMAGE_ARCHIVES[path]
+        if fingerprint is None:
+            return None
+        try:
+            archive = zipfile.ZipFile(path)
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"Failed to open image archive {path}: {e}")
+            return None
+        members = {
+            Path(info.filename).name.lower(): info for info in archive.infolist() if not info.is_dir()
+        }
+        IMAGE_ARCHIVES[path] = (fingerprint, (archive, members))
+        return archive, members
+
+def read_image_file(image_dir, filename):
+    """Return the bytes of filename from an image folder or artwork archive, or None."""
+    if not image_dir:
+        return None
+    if is_image_archive(image_dir):
+        found = get_image_archive(image_dir)
+        info = found[1].get(filename.lower()) if found else None
+        if info is None:
+            return None
+        try:
+            return found[0].read(info)
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            print(f"Failed to read {filename} from {image_dir}: {e}")
+            return None
+    path = find_file_cached(image_dir, filename)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def image_file_fingerprint(image_dir, filename):
+    """Cheap change marker for one image, without reading it."""
+    if is_image_archive(image_dir):
+        found = get_image_archive(image_dir)
+        info = found[1].get(filename.lower()) if found else None
+        return f"{info.CRC:08x}-{info.file_size}" if info else None
+    path = find_file_cached(image_dir, filename)
+    fingerprint = file_fingerprint(path) if path else None
+    return f"{fingerprint[1]}-{fingerprint[0]}" if fingerprint else None
+
+def dir_fingerprint(path, recursive=False):
+    """
+    Fingerprint a ROM folder by its mtime, which changes when files are added or removed.
+    Recursive scans (Neo-Geo CD) also include the mtimes of the immediate subfolders.
+    Some filesystems (FAT/exFAT, network shares) do not update folder mtimes; for those,
+    "Rescan ROM Folders" in the settings drops the scans (see invalidate_rom_cache).
+    """
+    fingerprint = file_fingerprint(path)
+    if fingerprint is None or not recursive:
+        return fingerprint
+    try:
+        subdirs = sorted((e.name, e.stat().st_mtime_ns) for e in os.scandir(path) if e.is_dir())
+    except OSError:
+        return fingerprint
+    return (fingerprint, tuple(subdirs))
+
+def get_layer_cached(cache_dict, layer, key, fingerprint, build):
+    """
+    Return the value cached for key in one pipeline layer (parsed DAT, titles file, directory
+    scan, merged list), calling build() only when the layer's input fingerprint changed.
+    """
+    with ROM_CACHE_LOCK:
+        entry = cache_dict.setdefault(("__layer__", layer), {}).get(key)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1]
+    value = build()
+    with ROM_CACHE_LOCK:
+        cache_dict.setdefault(("__layer__", layer), {})[key] = (fingerprint, value)
+    return value
+
+def invalidate_rom_cache(cache_dict, rescan=None):
+    """
+    Drop the merged lists and everything derived from them but keep the layers, so the next
+    get_rom_list_cached revalidates each layer by fingerprint and rebuilds only what changed.
+    With rescan, a set of (roms_dir, system_name), only those systems are dropped, including
+    their directory scans (and the merges keyed by their fingerprints), so their folders are
+    listed again.
+    """
+    with ROM_CACHE_LOCK:
+        if rescan is None:
+            for key in [k for k in cache_dict if k[0] != "__layer__"]:
+                del cache_dict[key]
+            return
+        scans = cache_dict.get(("__layer__", "scan"), {})
+        merges = cache_dict.get(("__layer__", "merge"), {})
+        for key in rescan:
+            scans.pop(key, None)
+        for key in [k for k in merges if k[:2] in rescan]:
+            del merges[key]
+        for key in [k for k in cache_dict if k[0] != "__layer__" and k[:2] in rescan]:
+            del cache_dict[key]
+
+def merge_rom_list(roms, rom_titles, meta, system_name):
     rom_list = []
     for rom in roms:
         stem = Path(rom).stem
@@ -195,7 +522,7 @@ def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, ca
             continue
         if system_name == "SNK Neo-Geo CD":
             if stem.lower() in meta:
-                title, year, manuf = meta[stem.lower()]
+                title, year, manuf = meta[stem.lower()][:3]
             else:
                 title = rom_titles.get(stem.lower(), stem)
                 year, manuf = "", ""
@@ -204,15 +531,229 @@ def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, ca
             if meta and stem.lower() not in meta:
                 continue
             if stem.lower() in meta:
-                title, year, manuf = meta[stem.lower()]
+                title, year, manuf = meta[stem.lower()][:3]
             else:
                 title = rom_titles.get(stem.lower(), stem)
                 year, manuf = "", ""
             rom_list.append((rom, title, year, manuf))
-    rom_list_sorted = sorted(rom_list, key=lambda x: x[1].lower())
-    cache_dict[cache_key] = rom_list_sorted
+    return sorted(rom_list, key=lambda x: x[1].lower())
+
+def get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
+    cache_key = (roms_dir, system_name, xml_dat_file)
+    cache = cache_dict.get(cache_key)
+    if cache is not None:
+        return cache
+    titles_fp = file_fingerprint(rom_titles_file)
+    rom_titles = get_layer_cached(
+        cache_dict, "titles", rom_titles_file, titles_fp, lambda: load_rom_titles(rom_titles_file)
+    )
+    dat_fp = file_fingerprint(xml_dat_file) if xml_dat_file else None
+    meta = get_layer_cached(
+        cache_dict, "dat", xml_dat_file, dat_fp,
+        lambda: parse_dat_metadata(xml_dat_file) if xml_dat_file else {}
+    )
+    parents = {name: m[3] for name, m in meta.items() if m[3]}
+    with ROM_CACHE_LOCK:
+        cache_dict[cache_key + ("parents",)] = parents
+    if not roms_dir or not os.path.exists(roms_dir):
+        with ROM_CACHE_LOCK:
+            cache_dict[cache_key] = []
+        return []
+    scan_fp = dir_fingerprint(roms_dir, recursive=system_name == "SNK Neo-Geo CD")
+    roms = get_layer_cached(
+        cache_dict, "scan", (roms_dir, system_name), scan_fp, lambda: scan_rom_dir(roms_dir, system_name)
+    )
+    rom_list_sorted = get_layer_cached(
+        cache_dict, "merge", cache_key, (titles_fp, dat_fp, scan_fp),
+        lambda: merge_rom_list(roms, rom_titles, meta, system_name)
+    )
+    with ROM_CACHE_LOCK:
+        cache_dict[cache_key] = rom_list_sorted
     return rom_list_sorted
 
+def load_rom_list_worker(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
+    """Fill cache_dict for one system off the GUI thread; failures cache an empty list."""
+    try:
+        get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict)
+    except Exception as e:
+        print(f"Failed to load ROM list for {system_name}: {e}")
+        with ROM_CACHE_LOCK:
+            cache_dict[(roms_dir, system_name, xml_dat_file)] = []
+
+def build_history_index(f):
+    """
+    Index a history.dat-style file: every name on a "$info=name1,name2," (or "$<system>=...")
+    line maps to the [offset, length] of the text between the following "$bio" and "$end" lines.
+    Other "$..." lines, such as "$<a href=...>" links, are not name lists.
+    """
+    entries = {}
+    names = []
+    start = None
+    offset = 0
+    for line in f:
+        stripped = line.strip()
+        if start is None:
+            key, _, value = stripped[1:].partition(b"=")
+            if stripped.startswith(b"$") and value and re.fullmatch(rb"\w+", key):
+                names.extend(
+                    name.strip().decode("utf-8", "replace").lower()
+                    for name in value.split(b",") if name.strip()
+                )
+            elif stripped == b"$bio" and names:
+                start = offset + len(line)
+        elif stripped == b"$end":
+            for name in names:
+                entries.setdefault(name, [start, offset - start])
+            names, start = [], None
+        offset += len(line)
+    return entries
+
+def build_category_index(f):
+    """Index a catver.ini-style file: each "name=Category" line in [Category] maps to the value's [offset, length]."""
+    entries = {}
+    section = None
+    offset = 0
+    for line in f:
+        stripped = line.strip()
+        if stripped.startswith(b"[") and stripped.endswith(b"]"):
+            section = stripped[1:-1].lower()
+        elif section == b"category" and b"=" in stripped and not stripped.startswith(b";"):
+            name, value = line.split(b"=", 1)
+            start = offset + len(name) + 1 + len(value) - len(value.lstrip())
+            entries[name.strip().decode("utf-8", "replace").lower()] = [start, len(value.strip())]
+        offset += len(line)
+    return entries
+
+METADATA_INDEX_BUILDERS = {"history": build_history_index, "category": build_category_index}
+
+class MetadataIndex:
+    """
+    rom name -> byte range of its entry in a large history.dat/catver.ini file.
+    The file is memory-mapped and entries are decoded only when asked for, so a
+    many-MB file costs little more than its name index.
+    """
+    def __init__(self, path, fingerprint, entries):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries = entries
+        self.map = None
+        with open(path, "rb") as f:
+            if fingerprint[0]:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, name):
+        entry = self.entries.get(name.lower())
+        if entry is None or self.map is None:
+            return ""
+        offset, length = entry
+        return self.map[offset:offset + length].decode("utf-8", "replace").strip()
+
+def metadata_index_file(path):
+    return METADATA_INDEX_DIR / f"{hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]}.json"
+
+def load_metadata_index(path, kind, fingerprint):
+    """Load the persisted index of one history/category file, or build and persist it; runs off the GUI thread."""
+    index = None
+    index_file = metadata_index_file(path)
+    try:
+        saved = None
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if saved and saved["path"] == path and saved["kind"] == kind and tuple(saved["fingerprint"]) == fingerprint:
+            entries = saved["entries"]
+        else:
+            with open(path, "rb") as f:
+                entries = METADATA_INDEX_BUILDERS[kind](f)
+            try:
+                METADATA_INDEX_DIR.mkdir(exist_ok=True)
+                tmp_path = index_file.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"path": path, "kind": kind, "fingerprint": list(fingerprint), "entries": entries}, f)
+                os.replace(tmp_path, index_file)
+            except OSError as e:
+                print(f"Failed to write {index_file}: {e}")
+        index = MetadataIndex(path, fingerprint, entries)
+    except (OSError, ValueError) as e:
+        print(f"Failed to index {path}: {e}")
+    with METADATA_INDEXES_LOCK:
+        METADATA_INDEXES_PENDING.discard(path)
+        if index is None:
+            METADATA_INDEXES_FAILED[path] = fingerprint
+        else:
+            METADATA_INDEXES[path] = index
+
+def get_metadata_index(path, kind):
+    """
+    Return the MetadataIndex of a history ("history") or category ("category") file, or None.
+    A missing or outdated index is loaded or rebuilt on a background thread (see
+    metadata_indexes_pending); each file's index is persisted separately in METADATA_INDEX_DIR
+    and rebuilt only when the file's size or mtime changes.
+    """
+    fingerprint = file_fingerprint(path) if path else None
+    if fingerprint is None:
+        return None
+    with METADATA_INDEXES_LOCK:
+        index = METADATA_INDEXES.get(path)
+        if index is not None and index.fingerprint == fingerprint:
+            return index
+        if path in METADATA_INDEXES_PENDING or METADATA_INDEXES_FAILED.get(path) == fingerprint:
+            return None
+        METADATA_INDEXES_PENDING.add(path)
+    threading.Thread(target=load_metadata_index, args=(path, kind, fingerprint), daemon=True).start()
+    return None
+
+def drop_metadata_cache_entry(key):
+    """MemoryBudget drop callback for metadata indexes and image folder listings/archives."""
+    kind, path = key
+    if kind == "index":
+        with METADATA_INDEXES_LOCK:
+            METADATA_INDEXES.pop(path, None)
+    elif kind == "archive":
+        # Not closed here: a loader thread may still be reading from it
+        with IMAGE_ARCHIVES_LOCK:
+            IMAGE_ARCHIVES.pop(path, None)
+    else:
+        DIR_LISTINGS.pop(path, None)
+
+def metadata_indexes_pending(path=None):
+    return path in METADATA_INDEXES_PENDING if path else bool(METADATA_INDEXES_PENDING)
+
+def group_rom_list(rom_list, parents):
+    """
+    Split a sorted ROM list into top-level rows and their clones.
+    Clones whose parent set is not present in the list stay top-level rows.
+    Returns (top_level, children) where children maps parent rom -> [clone records].
+    """
+    present = {Path(rom).stem.lower(): rom for rom, _, _, _ in rom_list}
+    top_level = []
+    children = {}
+    for record in rom_list:
+        parent = parents.get(Path(record[0]).stem.lower(), "")
+        if parent and parent in present:
+            children.setdefault(present[parent], []).append(record)
+        else:
+            top_level.append(record)
+    return top_level, children
+
+def get_rom_groups_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict):
+    groups_key = (roms_dir, system_name, xml_dat_file, "groups")
+    groups = cache_dict.get(groups_key)
+    if groups is not None:
+        return groups
+    parents_key = (roms_dir, system_name, xml_dat_file, "parents")
+    with ROM_CACHE_LOCK:
+        if parents_key not in cache_dict:
+            # Evicted with the other derived entries; rebuilding the list restores it from the layers
+            cache_dict.pop((roms_dir, system_name, xml_dat_file), None)
+    rom_list = get_rom_list_cached(rom_titles_file, roms_dir, system_name, xml_dat_file, cache_dict)
+    parents = cache_dict.get(parents_key, {})
+    groups = group_rom_list(rom_list, parents)
+    with ROM_CACHE_LOCK:
+        return cache_dict.setdefault(groups_key, groups)
+
 def filter_rom_list(rom_list, search="", year_filter="", manuf_filter=""):
     filtered = []
     for rom, title, year, manuf in rom_list:
@@ -224,39 +765,367 @@ def filter_rom_list(rom_list, search="", year_filter="", manuf_filter=""):
             filtered.append((rom, title, year, manuf))
     return filtered
 
-def run_rom(rom, roms_dir, retroarch, core, system_name, win):
-    rom_path = os.path.join(roms_dir, rom)
-    if not os.path.exists(rom_path):
-        QMessageBox.critical(win, "Error", f"ROM file not found: {rom_path}")
-        return
+def build_jump_index(titles, rows):
+    """
+    Build a jump index over title-sorted rows: (keys, rows), where keys are the lowercased
+    titles in list order, so letters and prefixes can be found by bisection.
+    """
+    return [title.lower() for title in titles], list(rows)
+
+def jump_index_row(index, current_row, direction=0, prefix=""):
+    """
+    Return the row to jump to: the first row starting with prefix, or the start of the
+    next (direction=1) / previous (direction=-1) first-letter group. None if there is none.
+    """
+    keys, rows = index
+    if not keys:
+        return None
+    if prefix:
+        pos = bisect.bisect_left(keys, prefix.lower())
+        return rows[pos] if pos < len(keys) and keys[pos].startswith(prefix.lower()) else None
+    pos = max(0, bisect.bisect_right(rows, current_row) - 1)
+    letter = keys[pos][:1]
+    start = bisect.bisect_left(keys, letter)
+    if direction > 0:
+        pos = bisect.bisect_left(keys, letter + "\uffff")
+        return rows[pos] if pos < len(keys) else rows[0]
+    if current_row > rows[start]:
+        return rows[start]
+    if start == 0:
+        return rows[bisect.bisect_left(keys, keys[-1][:1])]
+    return rows[bisect.bisect_left(keys, keys[start - 1][:1])]
+
+def popcount(bits):
+    return bits.bit_count() if hasattr(bits, "bit_count") else bin(bits).count("1")
+
+def bitset_rows(bits):
+    """Return the sorted row ids set in an int bitset."""
+    return [i for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"]
+
+def build_facet_index(rom_list, children=None):
+    """
+    Build year/manufacturer facet indexes over a ROM list.
+    Each facet maps value -> int bitset of row ids in rom_list, so filters combine by intersection.
+    With children (parent rom -> clone records), a parent row also carries its clones' values
+    and titles, so grouping never hides a matching clone.
+    """
+    children = children or {}
+    years = {}
+    manufs = {}
+    titles = []
+    for i, record in enumerate(rom_list):
+        members = [record] + children.get(record[0], [])
+        for _, _, year, manuf in members:
+            years.setdefault(year, []).append(i)
+            manufs.setdefault(manuf, []).append(i)
+        titles.append("\n".join(title.lower() for _, title, _, _ in members))
+
+    def to_bitset(rows):
+        bits = 0
+        for i in rows:
+            bits |= 1 << i
+        return bits
+
+    return {
+        "all": (1 << len(rom_list)) - 1,
+        "titles": titles,
+        "year": {value: to_bitset(rows) for value, rows in years.items()},
+        "manuf": {value: to_bitset(rows) for value, rows in manufs.items()},
+        "search": ("", (1 << len(rom_list)) - 1),
+    }
+
+def get_facet_index_cached(rom_list, cache_key, cache_dict, children=None):
+    facets_key = cache_key + ("facets",)
+    facets = cache_dict.get(facets_key)
+    if facets is None:
+        facets = build_facet_index(rom_list, children)
+        with ROM_CACHE_LOCK:
+            facets = cache_dict.setdefault(facets_key, facets)
+    return facets
+
+def facet_mask(facet, match):
+    mask = 0
+    for value, bits in facet.items():
+        if match(value):
+            mask |= bits
+    return mask
+
+def facet_counts(facet, mask):
+    counts = {}
+    for value, bits in facet.items():
+        count = popcount(bits & mask)
+        if value and count:
+            counts[value] = count
+    return counts
+
+def search_mask(facets, search):
+    last_search, last_mask = facets["search"]
+    if search == last_search:
+        return last_mask
+    # Refining the previous search only needs to rescan its matches
+    rows = bitset_rows(last_mask) if last_search and last_search in search else range(len(facets["titles"]))
+    mask = 0
+    titles = facets["titles"]
+    for i in rows:
+        if search in titles[i]:
+            mask |= 1 << i
+    facets["search"] = (search, mask)
+    return mask
+
+def facet_filter_rom_list(rom_list, facets, search="", year_filter="", manuf_filter="",
+                          categories=None, category_filter=""):
+    """
+    Filter rom_list through its facet index; same matching rules as filter_rom_list.
+    categories is an optional category facet (see get_category_facet_cached); ROMs without
+    one never match a category filter.
+    Returns (filtered, year_counts, manuf_counts, category_counts), where each facet's counts
+    combine the current search with the other facets' filters.
+    """
+    found = search_mask(facets, search) if search else facets["all"]
+    years = facet_mask(facets["year"], lambda v: year_filter in v) if year_filter else facets["all"]
+    manuf_filter = manuf_filter.lower()
+    manufs = facet_mask(facets["manuf"], lambda v: manuf_filter in v.lower()) if manuf_filter else facets["all"]
+    category_filter = category_filter.lower()
+    cats = facet_mask(categories or {}, lambda v: category_filter in v.lower()) if category_filter else facets["all"]
+    filtered = [rom_list[i] for i in bitset_rows(found & years & manufs & cats)]
+    year_counts = facet_counts(facets["year"], found & manufs & cats)
+    manuf_counts = facet_counts(facets["manuf"], found & years & cats)
+    category_counts = facet_counts(categories, found & years & manufs) if categories else {}
+    return filtered, year_counts, manuf_counts, category_counts
+
+def get_category_facet_cached(rom_list, cache_key, index, cache_dict, children=None):
+    """Category -> int bitset of rows in rom_list, read from a category MetadataIndex and cached per file version."""
+    categories_key = cache_key + ("categories",)
+    cached = cache_dict.get(categories_key)
+    version = (index.path, index.fingerprint)
+    if cached is None or cached[0] != version:
+        children = children or {}
+        facet = {}
+        for i, record in enumerate(rom_list):
+            for rom, _, _, _ in [record] + children.get(record[0], []):
+                category = index.get(Path(rom).stem)
+                facet[category] = facet.get(category, 0) | (1 << i)
+        cached = (version, facet)
+        with ROM_CACHE_LOCK:
+            cache_dict[categories_key] = cached
+    return cached[1]
+
+def validate_launcher(retroarch, core):
+    """
+    Return an error message for an unusable RetroArch executable/core, or None.
+    Successful checks are cached until clear_launcher_validation() is called.
+    """
+    if (retroarch, core) in LAUNCHER_VALIDATION_CACHE:
+        return None
     if not os.path.exists(retroarch) or not os.access(retroarch, os.X_OK):
-        QMessageBox.critical(win, "Error", f"Invalid RetroArch executable: {retroarch}")
-        return
+        return f"Invalid RetroArch executable: {retroarch}"
     if not os.path.exists(core):
-        QMessageBox.critical(win, "Error", f"Invalid RetroArch core: {core}")
-        return
+        return f"Invalid RetroArch core: {core}"
     if not (core.lower().endswith(".dll") or core.lower().endswith(".so") or core.lower().endswith(".dylib")):
-        QMessageBox.critical(
-            win,
-            "Error",
-            f"Core file must end with .dll (Windows), .so (Linux), or .dylib (macOS): {core}"
-        )
-        return
+        return f"Core file must end with .dll (Windows), .so (Linux), or .dylib (macOS): {core}"
+    LAUNCHER_VALIDATION_CACHE.add((retroarch, core))
+    return None
+
+def clear_launcher_validation():
+    LAUNCHER_VALIDATION_CACHE.clear()
+
+def run_rom(rom, roms_dir, retroarch, core, system_name, win, history=None, meta=None):
+    rom_path = os.path.join(roms_dir, rom)
+    if not os.path.exists(rom_path):
+        QMessageBox.critical(win, "Error", f"ROM file not found: {rom_path}")
+        return None
+    error = validate_launcher(retroarch, core)
+    if error:
+        QMessageBox.critical(win, "Error", error)
+        return None
     cmd = [retroarch, "-L", core]
     if system_name == "SNK Neo-Geo CD" or rom.lower().endswith(".cue"):
         cmd.extend(["--subsystem", "neocd"])
     cmd.append(rom_path)
     try:
-        subprocess.Popen(cmd)
+        proc = subprocess.Popen(cmd)
     except Exception as e:
+        LAUNCHER_VALIDATION_CACHE.discard((retroarch, core))
         QMessageBox.critical(win, "Error", f"Failed to launch ROM: {e}")
+        return None
+    if history is not None:
+        title, year, manuf = meta or (Path(rom).stem, "", "")
+        history.record_launch(system_name, rom, title, year, manuf)
+    return proc
+
+class PlayHistory:
+    """
+    Launch events and (optionally) favorites in a local SQLite database in WAL mode.
+    Every launch also updates a per-ROM summary row, so the "Recently played" and
+    "Most played" views are index scans however many events have been recorded.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS launches (
+            id INTEGER PRIMARY KEY,
+            system TEXT NOT NULL,
+            rom TEXT NOT NULL,
+            launched_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS launches_rom ON launches (system, rom, launched_at);
+        CREATE TABLE IF NOT EXISTS play_stats (
+            system TEXT NOT NULL,
+            rom TEXT NOT NULL,
+            title TEXT NOT NULL,
+            year TEXT NOT NULL,
+            manuf TEXT NOT NULL,
+            play_count INTEGER NOT NULL,
+            last_played REAL NOT NULL,
+            PRIMARY KEY (system, rom)
+        );
+        CREATE INDEX IF NOT EXISTS play_stats_recent ON play_stats (last_played DESC);
+        CREATE INDEX IF NOT EXISTS play_stats_count ON play_stats (play_count DESC, last_played DESC);
+        CREATE TABLE IF NOT EXISTS favorites (
+            system TEXT NOT NULL,
+            rom TEXT NOT NULL,
+            title TEXT NOT NULL,
+            year TEXT NOT NULL,
+            manuf TEXT NOT NULL,
+            added_at REAL NOT NULL,
+            PRIMARY KEY (system, rom)
+        );
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def record_launch(self, system, rom, title, year, manuf, when=None):
+        when = time.time() if when is None else when
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO launches (system, rom, launched_at) VALUES (?, ?, ?)", (system, rom, when)
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO play_stats VALUES (?, ?, ?, ?, ?, 0, ?)",
+                (system, rom, title, year, manuf, when)
+            )
+            self.conn.execute(
+                "UPDATE play_stats SET play_count = play_count + 1, last_played = ?, title = ?, year = ?, manuf = ? "
+                "WHERE system = ? AND rom = ?",
+                (when, title, year, manuf, system, rom)
+            )
+
+    def recent(self, limit=200):
+        return self.conn.execute(
+            "SELECT system, rom, title, year, manuf, play_count, last_played FROM play_stats "
+            "ORDER BY last_played DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def most_played(self, limit=200):
+        return self.conn.execute(
+            "SELECT system, rom, title, year, manuf, play_count, last_played FROM play_stats "
+            "ORDER BY play_count DESC, last_played DESC LIMIT ?", (limit,)
+        ).fetchall()
+
+    def favorites(self):
+        return [
+            list(row) for row in self.conn.execute(
+                "SELECT system, rom, title, year, manuf FROM favorites ORDER BY added_at"
+            )
+        ]
+
+    def add_favorite(self, system, rom, title, year, manuf):
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT OR IGNORE INTO favorites VALUES (?, ?, ?, ?, ?, ?)",
+                (system, rom, title, year, manuf, time.time())
+            )
+        return cur.rowcount > 0
+
+    def remove_favorite(self, system, rom):
+        with self.conn:
+            self.conn.execute("DELETE FROM favorites WHERE system = ? AND rom = ?", (system, rom))
+
+    def replace_favorites(self, favorites):
+        with self.conn:
+            self.conn.execute("DELETE FROM favorites")
+            now = time.time()
+            for i, (system, rom, title, year, manuf) in enumerate(favorites):
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO favorites VALUES (?, ?, ?, ?, ?, ?)",
+                    (system, rom, title, year, manuf, now + i * 1e-6)
+                )
+
+    def close(self):
+        self.conn.close()
+
+def rom_data_files(rom_path):
+    """Return the files RetroArch will read for a ROM: the file itself, plus the tracks of a .cue sheet."""
+    files = [rom_path]
+    if rom_path.lower().endswith(".cue"):
+        try:
+            with open(rom_path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    parts = line.strip().split('"')
+                    if line.strip().upper().startswith("FILE") and len(parts) >= 3:
+                        files.append(os.path.join(os.path.dirname(rom_path), parts[1]))
+        except OSError:
+            pass
+    return files
+
+class RomPrefetcher:
+    """
+    Warm the OS page cache for the selected ROM in a background thread, so RetroArch reads it
+    from memory. Reads sequentially up to limit bytes, after a posix_fadvise(WILLNEED) hint
+    where available so the kernel reads ahead in parallel; done_path is only set once the data
+    has actually been read. A newer request or cancel() stops the running one.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.generation = 0
+        self.done_path = None
+
+    def prefetch(self, rom_path):
+        if rom_path == self.done_path:
+            return
+        self.generation += 1
+        self.done_path = None
+        if self.limit > 0:
+            threading.Thread(target=self.run, args=(rom_path, self.generation), daemon=True).start()
+
+    def cancel(self):
+        self.generation += 1
+
+    def run(self, rom_path, generation):
+        budget = self.limit
+        try:
+            for path in rom_data_files(rom_path):
+                with open(path, "rb") as f:
+                    length = min(os.fstat(f.fileno()).st_size, budget)
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, length, os.POSIX_FADV_WILLNEED)
+                    # The hint is only asynchronous; reading makes "pre-read" true
+                    remaining = length
+                    while remaining > 0 and generation == self.generation:
+                        chunk = f.read(min(remaining, 1024 * 1024))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                budget -= length
+                if generation != self.generation or budget <= 0:
+                    break
+        except OSError:
+            return
+        if generation == self.generation:
+            self.done_path = rom_path
 
 class FavoritesDialog(QDialog):
-    def __init__(self, cfg, parent=None, current_system_callback=None):
+    CLOSE_BUTTON = "button_favorites"
+
+    def __init__(self, cfg, parent=None, current_system_callback=None, history=None):
         super().__init__(parent)
         self.setWindowTitle("Favorite ROMs")
         self.cfg = cfg
         self.current_system_callback = current_system_callback
+        self.history = history
+        self.entries = []
         self.layout = QVBoxLayout(self)
 
         self.favorites_list = QListWidget()
@@ -288,28 +1157,40 @@ class FavoritesDialog(QDialog):
         self.favorites_list.setFocusPolicy(Qt.StrongFocus)
         self.favorites_list.setFocus()
 
+    def load_entries(self):
+        if self.history is not None and self.cfg.get("favorites_in_database", False):
+            return self.history.favorites()
+        return self.cfg["favorites"]
+
+    def format_entry(self, entry):
+        system_name, rom, title, year, manuf = entry[:5]
+        display = f"{title} [{system_name}]"
+        if year or manuf:
+            display += f" [{year}]" if year else ""
+            display += f" ({manuf})" if manuf else ""
+        return display
+
     def update_favorites_list(self):
+        self.entries = self.load_entries()
         self.favorites_list.clear()
-        for fav in self.cfg["favorites"]:
-            system_name, rom, title, year, manuf = fav
-            display = f"{title} [{system_name}]"
-            if year or manuf:
-                display += f" [{year}]" if year else ""
-                display += f" ({manuf})" if manuf else ""
-            self.favorites_list.addItem(display)
+        for entry in self.entries:
+            self.favorites_list.addItem(self.format_entry(entry))
 
     def launch_selected_favorite(self, *args):
         idx = self.favorites_list.currentRow()
-        if idx < 0 or not self.cfg["favorites"]:
+        if idx < 0 or not self.entries:
             QMessageBox.critical(self, "Warning", "Select a favorite ROM.")
             return
-        system_name, rom, title, _, _ = self.cfg["favorites"][idx]
+        system_name, rom, title, year, manuf = self.entries[idx][:5]
         roms_dir = self.cfg["roms_dirs"].get(system_name, "")
-        run_rom(rom, roms_dir, self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], system_name, self)
+        run_rom(
+            rom, roms_dir, self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], system_name, self,
+            history=self.history, meta=(title, year, manuf)
+        )
 
     def show_context_menu(self, position):
         idx = self.favorites_list.currentRow()
-        if idx < 0 or not self.cfg["favorites"]:
+        if idx < 0 or not self.entries:
             return
         menu = QMenu()
         remove_from_favorites = menu.addAction("Remove from Favorites")
@@ -318,12 +1199,15 @@ class FavoritesDialog(QDialog):
             self.remove_selected_favorite(idx)
 
     def remove_selected_favorite(self, idx):
-        if idx < 0 or not self.cfg["favorites"]:
+        if idx < 0 or not self.entries:
             QMessageBox.critical(self, "Warning", "Select a favorite ROM to remove.")
             return
-        title = self.cfg["favorites"][idx][2]
-        self.cfg["favorites"].pop(idx)
-        save_config(self.cfg)
+        system_name, rom, title = self.entries[idx][:3]
+        if self.history is not None and self.cfg.get("favorites_in_database", False):
+            self.history.remove_favorite(system_name, rom)
+        else:
+            self.cfg["favorites"].pop(idx)
+            save_config(self.cfg)
         self.update_favorites_list()
         QMessageBox.information(self, "Favorites", f"Removed '{title}' from favorites.")
 
@@ -378,7 +1262,7 @@ class FavoritesDialog(QDialog):
             check_button("button_up", lambda: self.favorites_list.setCurrentRow(max(0, self.favorites_list.currentRow() - 1)))
             check_button("button_down", lambda: self.favorites_list.setCurrentRow(min(self.favorites_list.count() - 1, self.favorites_list.currentRow() + 1)))
             check_button("button_select", self.launch_selected_favorite)
-            check_button("button_favorites", self.close)
+            check_button(self.CLOSE_BUTTON, self.close)
 
         self.timer.start(self.polling_interval)
 
@@ -389,14 +1273,47 @@ class FavoritesDialog(QDialog):
                 return True
         return super().eventFilter(obj, event)
 
+class HistoryDialog(FavoritesDialog):
+    CLOSE_BUTTON = "button_history"
+    VIEWS = ["Recently Played", "Most Played"]
+    view = 0
+
+    def __init__(self, cfg, history, parent=None):
+        super().__init__(cfg, parent, history=history)
+        self.setWindowTitle("Play History")
+        self.view_combo = QComboBox()
+        self.view_combo.addItems(self.VIEWS)
+        self.view_combo.currentIndexChanged.connect(self.set_view)
+        self.layout.insertWidget(0, self.view_combo)
+
+    def set_view(self, view):
+        self.view = view
+        self.update_favorites_list()
+        self.favorites_list.setFocus()
+
+    def load_entries(self):
+        return self.history.most_played() if self.view else self.history.recent()
+
+    def format_entry(self, entry):
+        display = super().format_entry(entry)
+        play_count, last_played = entry[5:7]
+        if self.view:
+            return f"{display} - played {play_count}x"
+        return f"{display} - {time.strftime('%Y-%m-%d %H:%M', time.localtime(last_played))}"
+
+    def show_context_menu(self, position):
+        pass
+
 class SettingsDialog(QDialog):
-    def __init__(self, cfg, parent, current_system_callback, auto_create_titles_callback, update_rom_list_callback):
+    def __init__(self, cfg, parent, current_system_callback, auto_create_titles_callback, update_rom_list_callback,
+                 rescan_callback):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.cfg = cfg
         self.current_system_callback = current_system_callback
         self.auto_create_titles_callback = auto_create_titles_callback
         self.update_rom_list_callback = update_rom_list_callback
+        self.rescan_callback = rescan_callback
 
         scroll = QScrollArea(self)
         scroll.setWidgetResizable(True)
@@ -428,6 +1345,23 @@ class SettingsDialog(QDialog):
         general_layout.addRow("RetroArch Executable:", retroarch_row)
         general_layout.addRow("RetroArch Core:", core_row)
         general_layout.addRow("", core_hint)
+        self.memory_budget_edit = QLineEdit(str(cfg.get("memory_budget_mb", 256)))
+        self.memory_budget_edit.setMaximumWidth(80)
+        general_layout.addRow("Cache Memory Budget (MB):", self.memory_budget_edit)
+        self.readahead_edit = QLineEdit(str(cfg.get("readahead_mb", 256)))
+        self.readahead_edit.setMaximumWidth(80)
+        general_layout.addRow("ROM Read-ahead Limit (MB, 0 = off):", self.readahead_edit)
+        self.api_server_chk = QCheckBox("Enable HTTP/JSON API for remote front-ends")
+        self.api_server_chk.setChecked(cfg.get("api_server", False))
+        general_layout.addRow(self.api_server_chk)
+        api_row = QHBoxLayout()
+        self.api_host_edit = QLineEdit(cfg.get("api_host", "127.0.0.1"))
+        self.api_port_edit = QLineEdit(str(cfg.get("api_port", 8780)))
+        self.api_port_edit.setMaximumWidth(80)
+        api_row.addWidget(self.api_host_edit)
+        api_row.addWidget(QLabel("Port:"))
+        api_row.addWidget(self.api_port_edit)
+        general_layout.addRow("API Address (0.0.0.0 = LAN):", api_row)
         general_group.setLayout(general_layout)
 
         joystick_group = QGroupBox("Joystick Buttons")
@@ -436,21 +1370,31 @@ class SettingsDialog(QDialog):
         self.hat_scroll_cooldown = QLineEdit(str(jc.get("hat_scroll_cooldown", 0.08)))
         self.hat_fastest_steps = QLineEdit(str(jc.get("hat_fastest_steps", 10)))
         self.hat_fastest_delay = QLineEdit(str(jc.get("hat_fastest_delay", 0.02)))
+        self.image_settle_delay = QLineEdit(str(jc.get("image_settle_delay", 0.15)))
         self.button_up = QLineEdit(str(jc.get("button_up", 2)))
         self.button_down = QLineEdit(str(jc.get("button_down", 3)))
         self.button_select = QLineEdit(str(jc.get("button_select", 0)))
         self.button_favorites = QLineEdit(str(jc.get("button_favorites", 7)))
         self.button_prev_tab = QLineEdit(str(jc.get("button_prev_tab", 4)))
         self.button_next_tab = QLineEdit(str(jc.get("button_next_tab", 5)))
+        self.button_toggle_clones = QLineEdit(str(jc.get("button_toggle_clones", -1)))
+        self.button_prev_letter = QLineEdit(str(jc.get("button_prev_letter", -1)))
+        self.button_next_letter = QLineEdit(str(jc.get("button_next_letter", -1)))
+        self.button_history = QLineEdit(str(jc.get("button_history", -1)))
         joystick_layout.addRow("Hat Scroll Cooldown (s):", self.hat_scroll_cooldown)
         joystick_layout.addRow("Hat Fastest Steps (hold):", self.hat_fastest_steps)
         joystick_layout.addRow("Hat Fastest Delay (s):", self.hat_fastest_delay)
+        joystick_layout.addRow("Image Load Delay (s):", self.image_settle_delay)
         joystick_layout.addRow("Button Up Index:", self.button_up)
         joystick_layout.addRow("Button Down Index:", self.button_down)
         joystick_layout.addRow("Button Select Index:", self.button_select)
         joystick_layout.addRow("Button Favorites Index:", self.button_favorites)
         joystick_layout.addRow("Button Prev System Index:", self.button_prev_tab)
         joystick_layout.addRow("Button Next System Index:", self.button_next_tab)
+        joystick_layout.addRow("Button Expand/Collapse Clones Index (-1 = off):", self.button_toggle_clones)
+        joystick_layout.addRow("Button Prev Letter Index (-1 = off):", self.button_prev_letter)
+        joystick_layout.addRow("Button Next Letter Index (-1 = off):", self.button_next_letter)
+        joystick_layout.addRow("Button Play History Index (-1 = off):", self.button_history)
         joystick_group.setLayout(joystick_layout)
 
         sys_group = QGroupBox("System")
@@ -478,6 +1422,28 @@ class SettingsDialog(QDialog):
         xml_file_row.addWidget(self.xml_file_btn)
         sys_layout.addRow("XML/DAT File:", xml_file_row)
 
+        self.history_file_edit = QLineEdit()
+        self.history_file_btn = QPushButton("Choose...")
+        self.history_file_btn.setMaximumWidth(80)
+        self.history_file_btn.clicked.connect(
+            lambda: self.choose_text_file(self.history_file_edit, "Select History File", "History Files (*.dat *.txt)")
+        )
+        history_file_row = QHBoxLayout()
+        history_file_row.addWidget(self.history_file_edit)
+        history_file_row.addWidget(self.history_file_btn)
+        sys_layout.addRow("History File (history.dat):", history_file_row)
+
+        self.category_file_edit = QLineEdit()
+        self.category_file_btn = QPushButton("Choose...")
+        self.category_file_btn.setMaximumWidth(80)
+        self.category_file_btn.clicked.connect(
+            lambda: self.choose_text_file(self.category_file_edit, "Select Category File", "Category Files (*.ini *.txt)")
+        )
+        category_file_row = QHBoxLayout()
+        category_file_row.addWidget(self.category_file_edit)
+        category_file_row.addWidget(self.category_file_btn)
+        sys_layout.addRow("Category File (catver.ini):", category_file_row)
+
         self.title_img_edit = QLineEdit()
         self.title_img_btn = QPushButton("Choose...")
         self.title_img_btn.setMaximumWidth(80)
@@ -485,7 +1451,11 @@ class SettingsDialog(QDialog):
         title_img_row = QHBoxLayout()
         title_img_row.addWidget(self.title_img_edit)
         title_img_row.addWidget(self.title_img_btn)
-        sys_layout.addRow("Title Image Folder:", title_img_row)
+        self.title_zip_btn = QPushButton("Zip...")
+        self.title_zip_btn.setMaximumWidth(80)
+        self.title_zip_btn.clicked.connect(lambda: self.choose_image_archive(self.title_img_edit))
+        title_img_row.addWidget(self.title_zip_btn)
+        sys_layout.addRow("Title Image Folder/Zip:", title_img_row)
 
         self.preview_img_edit = QLineEdit()
         self.preview_img_btn = QPushButton("Choose...")
@@ -494,15 +1464,43 @@ class SettingsDialog(QDialog):
         preview_img_row = QHBoxLayout()
         preview_img_row.addWidget(self.preview_img_edit)
         preview_img_row.addWidget(self.preview_img_btn)
-        sys_layout.addRow("Preview Image Folder:", preview_img_row)
+        self.preview_zip_btn = QPushButton("Zip...")
+        self.preview_zip_btn.setMaximumWidth(80)
+        self.preview_zip_btn.clicked.connect(lambda: self.choose_image_archive(self.preview_img_edit))
+        preview_img_row.addWidget(self.preview_zip_btn)
+        sys_layout.addRow("Preview Image Folder/Zip:", preview_img_row)
 
         self.display_only_rom_list_chk = QCheckBox("Display only the ROM list (hide title/preview tabs)")
         self.display_only_rom_list_chk.setChecked(cfg.get("display_only_rom_list", False))
         sys_layout.addRow(self.display_only_rom_list_chk)
 
+        self.resident_mode_chk = QCheckBox("Resident mode (keep running hidden after closing)")
+        self.resident_mode_chk.setChecked(cfg.get("resident_mode", False))
+        sys_layout.addRow(self.resident_mode_chk)
+
+        self.thumbnail_cache_chk = QCheckBox("Cache downscaled title/preview images locally")
+        self.thumbnail_cache_chk.setChecked(cfg.get("thumbnail_cache", True))
+        sys_layout.addRow(self.thumbnail_cache_chk)
+
+        self.video_snaps_chk = QCheckBox("Play video snaps (.mp4) in the Preview tab (requires opencv-python)")
+        self.video_snaps_chk.setChecked(cfg.get("video_snaps", True))
+        self.video_snaps_chk.setEnabled(cv2 is not None)
+        sys_layout.addRow(self.video_snaps_chk)
+
+        self.favorites_in_database_chk = QCheckBox("Store favorites in the play history database")
+        self.favorites_in_database_chk.setChecked(cfg.get("favorites_in_database", False))
+        sys_layout.addRow(self.favorites_in_database_chk)
+
         self.auto_titles_btn = QPushButton("Auto-create ROM Titles")
         self.auto_titles_btn.clicked.connect(self.auto_create_titles)
         sys_layout.addRow(self.auto_titles_btn)
+        self.auto_titles_all_btn = QPushButton("Auto-create ROM Titles (All Systems)")
+        self.auto_titles_all_btn.clicked.connect(self.auto_create_titles_all)
+        sys_layout.addRow(self.auto_titles_all_btn)
+        self.rescan_btn = QPushButton("Rescan ROM Folders")
+        self.rescan_btn.setToolTip("List every ROM folder again, e.g. on drives that do not update folder times")
+        self.rescan_btn.clicked.connect(self.rescan_callback)
+        sys_layout.addRow(self.rescan_btn)
         sys_group.setLayout(sys_layout)
 
         self.save_btn = QPushButton("Save")
@@ -534,6 +1532,8 @@ class SettingsDialog(QDialog):
         sys_name = self.sys_dropdown.currentText()
         self.rom_folder_edit.setText(str(self.cfg["roms_dirs"].get(sys_name, "")))
         self.xml_file_edit.setText(str(self.cfg["xml_dat_files"].get(sys_name, "")))
+        self.history_file_edit.setText(str(self.cfg["history_files"].get(sys_name, "")))
+        self.category_file_edit.setText(str(self.cfg["category_files"].get(sys_name, "")))
         self.title_img_edit.setText(str(self.cfg["title_image_dirs"].get(sys_name, "")))
         self.preview_img_edit.setText(str(self.cfg["preview_image_dirs"].get(sys_name, "")))
 
@@ -543,7 +1543,7 @@ class SettingsDialog(QDialog):
             self.rom_folder_edit.setText(folder)
 
     def choose_xml_file(self):
-        fname, _ = QFileDialog.getOpenFileName(self, "Select XML/DAT File", "", "XML/DAT Files (*.xml *.dat);;All Files (*)")
+        fname, _ = QFileDialog.getOpenFileName(self, "Select XML/DAT File", "", "XML/DAT Files (*.xml *.dat *.gz *.zip *.7z);;All Files (*)")
         if fname:
             self.xml_file_edit.setText(fname)
 
@@ -557,6 +1557,16 @@ class SettingsDialog(QDialog):
         if folder:
             self.preview_img_edit.setText(folder)
 
+    def choose_text_file(self, edit, caption, file_filter):
+        fname, _ = QFileDialog.getOpenFileName(self, caption, "", f"{file_filter};;All Files (*)")
+        if fname:
+            edit.setText(fname)
+
+    def choose_image_archive(self, edit):
+        fname, _ = QFileDialog.getOpenFileName(self, "Select Image Archive", "", "Zip Archives (*.zip);;All Files (*)")
+        if fname:
+            edit.setText(fname)
+
     def auto_create_titles(self):
         sys_name = self.sys_dropdown.currentText()
         rom_folder = self.rom_folder_edit.text()
@@ -565,39 +1575,164 @@ class SettingsDialog(QDialog):
         if not rom_folder or not os.path.isdir(rom_folder):
             QMessageBox.warning(self, "Error", "Please set the ROMs folder for this system first.")
             return
-        ok, info = auto_create_rom_titles(rom_folder, xml_file, sys_name, rom_titles_file)
-        if ok:
+        ok, info, changed = auto_create_rom_titles(rom_folder, xml_file, sys_name, rom_titles_file)
+        if ok and not changed:
+            QMessageBox.information(self, "ROM Titles", f"{rom_titles_file} is already up to date ({info} entries)")
+        elif ok:
             QMessageBox.information(self, "ROM Titles", f"Created/Updated {rom_titles_file} ({info} entries)")
             self.auto_create_titles_callback()
         else:
             QMessageBox.critical(self, "Write Error", f"Could not write file:\n{info}")
 
+    def auto_create_titles_all(self):
+        current = self.sys_dropdown.currentText()
+        jobs = []
+        for c in TAB_CONFIGS:
+            sys_name = c["name"]
+            if sys_name == current:
+                rom_folder, xml_file = self.rom_folder_edit.text(), self.xml_file_edit.text()
+            else:
+                rom_folder = self.cfg["roms_dirs"].get(sys_name, "")
+                xml_file = self.cfg["xml_dat_files"].get(sys_name, "")
+            if rom_folder and os.path.isdir(rom_folder):
+                jobs.append((sys_name, rom_folder, xml_file, c["rom_titles_file"]))
+        if not jobs:
+            QMessageBox.warning(self, "Error", "Please set the ROMs folder for at least one system first.")
+            return
+        dlg = BatchTitlesDialog(jobs, self)
+        dlg.exec_()
+        if dlg.changed:
+            self.auto_create_titles_callback()
+
     def save(self):
         self.cfg["RETROARCH"] = self.retroarch_edit.text()
         self.cfg["RETROARCH_CORE"] = self.core_edit.text()
+        try:
+            self.cfg["memory_budget_mb"] = max(16, int(self.memory_budget_edit.text()))
+            self.cfg["readahead_mb"] = max(0, int(self.readahead_edit.text()))
+            self.cfg["api_port"] = int(self.api_port_edit.text())
+        except ValueError:
+            pass
+        self.cfg["api_server"] = self.api_server_chk.isChecked()
+        self.cfg["api_host"] = self.api_host_edit.text().strip() or "127.0.0.1"
+        clear_launcher_validation()
         jc = self.cfg["joystick_config"]
         try:
             jc["hat_scroll_cooldown"] = float(self.hat_scroll_cooldown.text())
             jc["hat_fastest_steps"] = int(self.hat_fastest_steps.text())
             jc["hat_fastest_delay"] = float(self.hat_fastest_delay.text())
+            jc["image_settle_delay"] = float(self.image_settle_delay.text())
             jc["button_up"] = int(self.button_up.text())
             jc["button_down"] = int(self.button_down.text())
             jc["button_select"] = int(self.button_select.text())
             jc["button_favorites"] = int(self.button_favorites.text())
             jc["button_prev_tab"] = int(self.button_prev_tab.text())
             jc["button_next_tab"] = int(self.button_next_tab.text())
+            jc["button_toggle_clones"] = int(self.button_toggle_clones.text())
+            jc["button_prev_letter"] = int(self.button_prev_letter.text())
+            jc["button_next_letter"] = int(self.button_next_letter.text())
+            jc["button_history"] = int(self.button_history.text())
         except Exception:
             pass
         sys_name = self.sys_dropdown.currentText()
         self.cfg["roms_dirs"][sys_name] = self.rom_folder_edit.text()
         self.cfg["xml_dat_files"][sys_name] = self.xml_file_edit.text()
+        self.cfg["history_files"][sys_name] = self.history_file_edit.text()
+        self.cfg["category_files"][sys_name] = self.category_file_edit.text()
         self.cfg["title_image_dirs"][sys_name] = self.title_img_edit.text()
         self.cfg["preview_image_dirs"][sys_name] = self.preview_img_edit.text()
         self.cfg["display_only_rom_list"] = self.display_only_rom_list_chk.isChecked()
+        self.cfg["thumbnail_cache"] = self.thumbnail_cache_chk.isChecked()
+        self.cfg["video_snaps"] = self.video_snaps_chk.isChecked()
+        self.cfg["resident_mode"] = self.resident_mode_chk.isChecked()
+        self.cfg["favorites_in_database"] = self.favorites_in_database_chk.isChecked()
         save_config(self.cfg)
         self.update_rom_list_callback()
         self.accept()
 
+class BatchTitlesDialog(QDialog):
+    """Regenerate the rom_titles_*.txt files of several systems in parallel worker processes."""
+    def __init__(self, jobs, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Auto-create ROM Titles")
+        self.jobs = jobs
+        self.changed = False
+        layout = QVBoxLayout(self)
+        self.status_list = QListWidget()
+        for sys_name, _, _, _ in jobs:
+            self.status_list.addItem(f"{sys_name}: working...")
+        layout.addWidget(self.status_list)
+        self.progress = QProgressBar()
+        self.progress.setRange(0, len(jobs))
+        layout.addWidget(self.progress)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_or_close)
+        layout.addWidget(self.cancel_btn)
+        self.setMinimumSize(420, 360)
+
+        # spawn rather than fork: the GUI process has Qt and worker threads running
+        context = multiprocessing.get_context("spawn")
+        self.pool = context.Pool(processes=min(len(jobs), os.cpu_count() or 1))
+        self.results = [
+            self.pool.apply_async(auto_create_rom_titles, (roms_dir, xml_file, sys_name, rom_titles_file))
+            for sys_name, roms_dir, xml_file, rom_titles_file in jobs
+        ]
+        self.pending = set(range(len(jobs)))
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll_results)
+        self.timer.start(100)
+
+    def poll_results(self):
+        for row in sorted(self.pending):
+            result = self.results[row]
+            if not result.ready():
+                continue
+            self.pending.discard(row)
+            sys_name = self.jobs[row][0]
+            try:
+                ok, info, changed = result.get()
+            except Exception as e:
+                ok, info, changed = False, str(e), False
+            if not ok:
+                text = f"{sys_name}: error - {info}"
+            elif changed:
+                text = f"{sys_name}: updated ({info} entries)"
+                self.changed = True
+            else:
+                text = f"{sys_name}: unchanged ({info} entries)"
+            self.status_list.item(row).setText(text)
+            self.progress.setValue(len(self.jobs) - len(self.pending))
+        if not self.pending:
+            self.finish()
+
+    def finish(self):
+        self.timer.stop()
+        self.pool.close()
+        self.pool.join()
+        self.cancel_btn.setText("Close")
+
+    def cancel(self):
+        if not self.pending:
+            return
+        self.timer.stop()
+        # Titles files are replaced atomically, so killing workers mid-job cannot truncate one
+        self.pool.terminate()
+        self.pool.join()
+        for row in self.pending:
+            self.status_list.item(row).setText(f"{self.jobs[row][0]}: cancelled")
+        self.pending.clear()
+        self.cancel_btn.setText("Close")
+
+    def cancel_or_close(self):
+        if self.pending:
+            self.cancel()
+        else:
+            self.accept()
+
+    def reject(self):
+        self.cancel()
+        super().reject()
+
 class AboutDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -627,6 +1762,570 @@ class AboutDialog(QDialog):
         self.setLayout(layout)
         self.setMinimumSize(400, 120)
 
+def estimate_size(obj):
+    """Approximate deep size in bytes of nested dicts/lists/tuples/sets of plain values."""
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+    return size
+
+class MemoryBudget:
+    """
+    Size-aware LRU bookkeeping shared by the ROM-list cache, search indexes and grid thumbnails.
+    Entries are keyed (cache, key); evict() drops the least recently used unpinned entries
+    through each cache's drop callback until the estimated total fits the limit.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.entries = OrderedDict()
+        self.droppers = {}
+
+    def register(self, cache, drop):
+        self.droppers[cache] = drop
+
+    def account(self, cache, key, label, value, size=None):
+        entry = self.entries.get((cache, key))
+        if entry is not None and entry[1] == id(value):
+            return
+        self.entries[(cache, key)] = (label, id(value), estimate_size(value) if size is None else size)
+        self.entries.move_to_end((cache, key))
+
+    def discard(self, cache, key):
+        self.entries.pop((cache, key), None)
+
+    def forget(self, cache, keep):
+        for entry_key in [k for k in self.entries if k[0] == cache and k[1] not in keep]:
+            del self.entries[entry_key]
+
+    def touch(self, cache, key):
+        if (cache, key) in self.entries:
+            self.entries.move_to_end((cache, key))
+
+    def total(self):
+        return sum(size for _, _, size in self.entries.values())
+
+    def usage(self):
+        usage = {}
+        for label, _, size in self.entries.values():
+            usage[label] = usage.get(label, 0) + size
+        return usage
+
+    def evict(self, pinned):
+        total = self.total()
+        for entry_key in list(self.entries):
+            if total <= self.limit:
+                break
+            # A drop callback may discard related entries along with its own
+            if entry_key in pinned or entry_key not in self.entries:
+                continue
+            del self.entries[entry_key]
+            self.droppers[entry_key[0]](entry_key[1])
+            total = self.total()
+        return total
+
+def make_thumbnail(image_dir, filename, max_width, max_height):
+    """Return PNG bytes of an image, downscaled to fit max_width x max_height."""
+    data = read_image_file(image_dir, filename)
+    image = QImage()
+    if not data or not image.loadFromData(data):
+        return None
+    if image.width() <= max_width and image.height() <= max_height:
+        return data
+    image = image.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+def load_grid_image(thumbnails, image_dir, filename, max_width, max_height):
+    """Decode and scale one grid cell image; runs off the GUI thread, so it returns a QImage."""
+    image = QImage()
+    data = thumbnails.get(image_dir, filename) if thumbnails else None
+    if not data or not image.loadFromData(data):
+        data = read_image_file(image_dir, filename)
+        if not data or not image.loadFromData(data):
+            return None
+    return image.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+class ThumbnailCache:
+    """
+    Downscaled copies of the title/preview PNGs, appended to one local pack file.
+    The index maps image dir -> lowercased file name -> [source name, mtime, offset, length],
+    so a lookup needs neither a directory listing nor a read from the image folder, only a
+    stat to check that the source image has not been replaced since it was packed.
+    """
+    def __init__(self, pack_path=THUMBNAIL_PACK, index_path=THUMBNAIL_INDEX, workers=2):
+        self.pack_path = Path(pack_path)
+        self.index_path = Path(index_path)
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.index = {}
+        self.outstanding = 0
+        self.refreshing = set()
+        self.stopped = False
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        if self.index_path.exists() and self.pack_path.exists():
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self.index = json.load(f)
+            except Exception as e:
+                print(f"Failed to read {self.index_path}: {e}")
+                self.index = {}
+        self.pack = open(self.pack_path, "a+b" if self.index else "w+b")
+        self.compact()
+
+    def compact(self):
+        """Rewrite the pack without stale entries once they take up more than half of it."""
+        live = sum(entry[3] for entries in self.index.values() for entry in entries.values())
+        size = self.pack.seek(0, os.SEEK_END)
+        if size <= 2 * live + 1024 * 1024:
+            return
+        tmp_path = self.pack_path.with_suffix(".pack.tmp")
+        with open(tmp_path, "wb") as out:
+            for entries in self.index.values():
+                for entry in entries.values():
+                    self.pack.seek(entry[2])
+                    data = self.pack.read(entry[3])
+                    entry[2] = out.tell()
+                    out.write(data)
+        self.pack.close()
+        os.replace(tmp_path, self.pack_path)
+        self.pack = open(self.pack_path, "a+b")
+        self.save_index()
+
+    def lookup(self, image_dir, filename):
+        """
+        Return the index entry of an image if its source is unchanged, else None.
+        A replaced image is repacked in the background; until then callers read the source.
+        """
+        entry = self.index.get(image_dir, {}).get(filename.lower())
+        if entry is None:
+            return None
+        marker = self.image_marker(image_dir, entry[0])
+        if marker == entry[1]:
+            return entry
+        with self.lock:
+            if marker is None or self.stopped or (image_dir, entry[0]) in self.refreshing:
+                return None
+            self.refreshing.add((image_dir, entry[0]))
+            self.outstanding += 1
+        self.pool.submit(self.add_thumbnail, image_dir, entry[0], marker)
+        return None
+
+    def get(self, image_dir, filename):
+        entry = self.lookup(image_dir, filename)
+        if entry is None:
+            return None
+        with self.lock:
+            if self.stopped:
+                return None
+            self.pack.seek(entry[2])
+            data = self.pack.read(entry[3])
+        return data if len(data) == entry[3] else None
+
+    def build(self, image_dirs):
+        """Queue a background refresh of every image dir; only new or modified PNGs are redone."""
+        for image_dir in dict.fromkeys(d for d in image_dirs if d):
+            with self.lock:
+                self.outstanding += 1
+            self.pool.submit(self.scan_dir, image_dir)
+
+    def image_marker(self, image_dir, filename):
+        """Return the change marker list_images records for one image, or None if it is gone."""
+        if is_image_archive(image_dir):
+            found = get_image_archive(image_dir)
+            info = found[1].get(filename.lower()) if found else None
+            return f"{info.CRC:08x}-{info.file_size}" if info else None
+        try:
+            return os.path.getmtime(os.path.join(image_dir, filename))
+        except OSError:
+            return None
+
+    def list_images(self, image_dir):
+        """Return [(file name, change marker)] for the PNGs of a folder or artwork archive, or None."""
+        if is_image_archive(image_dir):
+            found = get_image_archive(image_dir)
+            if found is None:
+                return None
+            return [
+                (Path(info.filename).name, f"{info.CRC:08x}-{info.file_size}")
+                for name, info in found[1].items() if name.endswith(".png")
+            ]
+        if not os.path.isdir(image_dir):
+            return None
+        images = []
+        for f in os.listdir(image_dir):
+            if not f.lower().endswith(".png"):
+                continue
+            try:
+                images.append((f, os.path.getmtime(os.path.join(image_dir, f))))
+            except OSError:
+                continue
+        return images
+
+    def scan_dir(self, image_dir):
+        try:
+            images = None if self.stopped else self.list_images(image_dir)
+            if images is None:
+                return
+            known = self.index.get(image_dir, {})
+            present = set()
+            for f, mtime in images:
+                present.add(f.lower())
+                entry = known.get(f.lower())
+                if entry is None or entry[0] != f or entry[1] != mtime:
+                    with self.lock:
+                        self.outstanding += 1
+                    self.pool.submit(self.add_thumbnail, image_dir, f, mtime)
+            with self.lock:
+                for name in set(known) - present:
+                    del known[name]
+        except Exception as e:
+            print(f"Failed to scan {image_dir}: {e}")
+        finally:
+            self.task_done()
+
+    def add_thumbnail(self, image_dir, filename, mtime):
+        try:
+            if self.stopped:
+                return
+            data = make_thumbnail(image_dir, filename, *THUMBNAIL_SIZE)
+            if not data:
+                return
+            with self.lock:
+                if self.stopped:
+                    return
+                offset = self.pack.seek(0, os.SEEK_END)
+                self.pack.write(data)
+                self.pack.flush()
+                self.index.setdefault(image_dir, {})[filename.lower()] = [filename, mtime, offset, len(data)]
+        except Exception as e:
+            print(f"Failed to create thumbnail for {filename}: {e}")
+        finally:
+            with self.lock:
+                self.refreshing.discard((image_dir, filename))
+            self.task_done()
+
+    def task_done(self):
+        with self.lock:
+            self.outstanding -= 1
+            idle = self.outstanding == 0
+        if idle:
+            self.save_index()
+
+    def save_index(self):
+        with self.save_lock:
+            with self.lock:
+                data = json.dumps(self.index)
+            tmp_path = self.index_path.with_suffix(".idx.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        self.stopped = True
+        self.pool.shutdown(wait=False)
+        self.save_index()
+        with self.lock:
+            self.pack.close()
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API for remote front-ends:
+      GET  /api/systems
+      GET  /api/roms?system=&search=&year=&manuf=&category=&offset=&limit=
+      GET  /api/image?system=&rom=&kind=title|preview
+      POST /api/launch  {"system": ..., "rom": ...}
+    """
+    MAX_PAGE = 500
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == "/api/systems":
+                self.send_json(self.server.systems())
+            elif url.path == "/api/roms":
+                page = self.server.rom_page(query)
+                if page is None:
+                    self.send_json({"error": "category index is still being built"}, 503, {"Retry-After": "2"})
+                else:
+                    self.send_json(page)
+            elif url.path == "/api/image":
+                self.send_image(query)
+            else:
+                self.send_error(404)
+        except (KeyError, ValueError) as e:
+            self.send_json({"error": str(e)}, 400)
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/api/launch":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            self.send_json(self.server.queue_launch(body["system"], body["rom"]), 202)
+        except (KeyError, ValueError, TypeError) as e:
+            self.send_json({"error": str(e)}, 400)
+
+    def not_modified(self, etag):
+        """Answer 304 if the client already holds this ETag."""
+        if f'"{etag}"' not in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            return False
+        self.send_response(304)
+        self.send_header("ETag", f'"{etag}"')
+        self.end_headers()
+        return True
+
+    def send_cached(self, data, content_type, etag, max_age=0):
+        if self.not_modified(etag):
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", f'"{etag}"')
+        self.send_header("Cache-Control", f"max-age={max_age}" if max_age else "no-cache")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, obj, status=200, headers=None):
+        data = json.dumps(obj).encode("utf-8")
+        if status == 200:
+            self.send_cached(data, "application/json", hashlib.sha1(data).hexdigest())
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_image(self, query):
+        found = self.server.image(query["system"], query["rom"], query.get("kind", "title"))
+        if found is None:
+            self.send_error(404)
+            return
+        etag, load = found
+        if self.not_modified(etag):
+            return
+        data = load()
+        if not data:
+            self.send_error(404)
+            return
+        self.send_cached(data, "image/png", etag, max_age=3600)
+
+class ApiServer(ThreadingHTTPServer):
+    """
+    Embedded HTTP server for the JSON API, running on its own threads.
+    Handlers fill the window's ROM cache through the same helpers as the background loader,
+    which serialize their writes on ROM_CACHE_LOCK; launches are queued and started by the
+    GUI thread, so no request ever waits on the Qt event loop.
+    """
+    daemon_threads = True
+
+    def __init__(self, window, host, port):
+        super().__init__((host, port), ApiRequestHandler)
+        self.window = window
+        self.address = (host, port)
+        self.launches = queue.Queue()
+        self.thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.1}, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def system_config(self, name):
+        for sys_cfg in TAB_CONFIGS:
+            if sys_cfg["name"] == name:
+                return sys_cfg
+        raise KeyError(f"unknown system: {name}")
+
+    def rom_list(self, sys_cfg):
+        args = self.window.rom_list_args(sys_cfg)
+        return args[1:], get_rom_list_cached(*args, self.window.rom_cache)
+
+    def systems(self):
+        result = []
+        for sys_cfg in TAB_CONFIGS:
+            cached = self.window.rom_cache.get(self.window.rom_list_args(sys_cfg)[1:])
+            result.append({
+                "name": sys_cfg["name"],
+                "count": len(cached) if cached is not None else None
+            })
+        return {"systems": result}
+
+    def rom_page(self, query):
+        """One page of a filtered ROM list, or None while the category index it needs is being built."""
+        sys_cfg = self.system_config(query["system"])
+        offset = max(0, int(query.get("offset", 0)))
+        limit = min(ApiRequestHandler.MAX_PAGE, max(1, int(query.get("limit", 50))))
+        cache_key, rom_list = self.rom_list(sys_cfg)
+        facets = get_facet_index_cached(rom_list, cache_key, self.window.rom_cache)
+        # The window's metadata helpers start Qt timers, which cannot be done from this thread
+        category_file = self.window.cfg["category_files"].get(sys_cfg["name"], "")
+        index = get_metadata_index(category_file, "category")
+        if index is None and query.get("category"):
+            if metadata_indexes_pending(category_file):
+                return None
+            # The build may have finished between the two calls
+            index = get_metadata_index(category_file, "category")
+        categories = get_category_facet_cached(rom_list, cache_key, index, self.window.rom_cache) if index else None
+        filtered = facet_filter_rom_list(
+            rom_list, facets, query.get("search", "").lower(), query.get("year", ""), query.get("manuf", ""),
+            categories, query.get("category", "")
+        )[0]
+        return {
+            "system": sys_cfg["name"],
+            "total": len(filtered),
+            "offset": offset,
+            "limit": limit,
+            "items": [
+                {"rom": rom, "title": title, "year": year, "manuf": manuf}
+                for rom, title, year, manuf in filtered[offset:offset + limit]
+            ]
+        }
+
+    def image(self, system_name, rom, kind):
+        """Return (etag, load) for a title/preview image, preferring the thumbnail pack, or None."""
+        self.system_config(system_name)
+        if kind not in ("title", "preview"):
+            raise ValueError(f"unknown image kind: {kind}")
+        image_dir = self.window.cfg[f"{kind}_image_dirs"].get(system_name, "")
+        prefix = self.window.SYSTEM_IMAGE_PREFIXES.get(system_name, "")
+        filename = f"{prefix}{Path(rom).stem.lower()}.png"
+        thumbnails = self.window.thumbnails
+        entry = thumbnails.lookup(image_dir, filename) if thumbnails else None
+        if entry is not None:
+            return f"{entry[1]}-{entry[3]}", lambda: thumbnails.get(image_dir, filename)
+        fingerprint = image_file_fingerprint(image_dir, filename)
+        if fingerprint is None:
+            return None
+        return fingerprint, lambda: make_thumbnail(image_dir, filename, *THUMBNAIL_SIZE)
+
+    def queue_launch(self, system_name, rom):
+        _, rom_list = self.rom_list(self.system_config(system_name))
+        for record in rom_list:
+            if record[0] == rom:
+                self.launches.put((system_name, record))
+                return {"queued": True, "system": system_name, "rom": rom}
+        raise KeyError(f"unknown ROM: {rom}")
+
+class MemoryDialog(QDialog):
+    def __init__(self, report_callback, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Memory Usage")
+        self.report_callback = report_callback
+        layout = QVBoxLayout(self)
+        self.report_label = QLabel()
+        self.report_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.report_label)
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        layout.addWidget(refresh_btn)
+        self.setMinimumSize(360, 200)
+        self.refresh()
+
+    def refresh(self):
+        self.report_label.setText(self.report_callback())
+
+class VideoSnapPlayer:
+    """
+    Decode a video snap with OpenCV on a worker thread, looping it until stopped.
+    Frames are scaled on the worker and handed over through a small bounded queue, so
+    decoding never runs more than BUFFER_FRAMES ahead of playback.
+    """
+    BUFFER_FRAMES = 8
+
+    def __init__(self, source_dir, filename, max_width, max_height):
+        self.source_dir = source_dir
+        self.filename = filename
+        self.path = None
+        self.max_size = (max_width, max_height)
+        self.fps = 0
+        self.frames = queue.Queue(maxsize=self.BUFFER_FRAMES)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        temp_path = None
+        if is_image_archive(self.source_dir):
+            # OpenCV only reads files, so a snap inside an artwork archive is copied out first
+            data = read_image_file(self.source_dir, self.filename)
+            if not data or self.stopped.is_set():
+                return
+            fd, temp_path = tempfile.mkstemp(suffix=Path(self.filename).suffix)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self.path = temp_path
+        else:
+            self.path = os.path.join(self.source_dir, self.filename)
+        capture = cv2.VideoCapture(self.path)
+        try:
+            if not capture.isOpened():
+                return
+            # Some containers report 0, NaN or absurd rates; the GUI timer interval comes from this
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            self.fps = min(60, max(1, fps)) if fps and math.isfinite(fps) else 30
+            while not self.stopped.is_set():
+                ok, frame = capture.read()
+                if not ok:
+                    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    ok, frame = capture.read()
+                    if not ok:
+                        return
+                image = self.to_image(frame)
+                while not self.stopped.is_set():
+                    try:
+                        self.frames.put(image, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            print(f"Failed to play {self.path}: {e}")
+        finally:
+            capture.release()
+            if temp_path:
+                os.remove(temp_path)
+
+    def to_image(self, frame):
+        height, width = frame.shape[:2]
+        scale = min(self.max_size[0] / width, self.max_size[1] / height, 1)
+        if scale < 1:
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        height, width = frame.shape[:2]
+        return QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGB888).copy()
+
+    def next_frame(self):
+        try:
+            return self.frames.get_nowait()
+        except queue.Empty:
+            return None
+
+    def stop(self):
+        self.stopped.set()
+        while self.next_frame() is not None:
+            pass
+
 class AspectRatioLabel(QLabel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -696,6 +2395,8 @@ class MainWindow(QMainWindow):
         "SNK Neo-Geo Pocket": "ngp_",
         "ZX Spectrum": "spec_"
     }
+    GRID_ICON_SIZE = (160, 120)
+    GRID_ICON_CACHE = 400
 
     def __init__(self):
         super().__init__()
@@ -708,6 +2409,7 @@ class MainWindow(QMainWindow):
         self.cfg = load_config()
         self.is_active = True
         self.favorites_dialog = None
+        self.history_dialog = None
 
         self.systems_combo = QComboBox()
         self.systems_combo.addItems([c["name"] for c in TAB_CONFIGS])
@@ -717,6 +2419,10 @@ class MainWindow(QMainWindow):
         self.search_edit.setPlaceholderText("Search ROMs...")
         self.search_edit.textChanged.connect(self.update_rom_list)
 
+        self.all_systems_chk = QCheckBox("All Systems")
+        self.all_systems_chk.setToolTip("Search every system at once")
+        self.all_systems_chk.toggled.connect(self.update_rom_list)
+
         self.year_edit = QLineEdit()
         self.year_edit.setPlaceholderText("Year")
         self.year_edit.setMaximumWidth(80)
@@ -727,6 +2433,27 @@ class MainWindow(QMainWindow):
         self.manuf_edit.setMaximumWidth(150)
         self.manuf_edit.textChanged.connect(self.update_rom_list)
 
+        self.category_edit = QLineEdit()
+        self.category_edit.setPlaceholderText("Category")
+        self.category_edit.setMaximumWidth(150)
+        self.category_edit.textChanged.connect(self.update_rom_list)
+
+        self.facet_counts = {"year": None, "manuf": None, "category": None}
+        self.facet_completers = {}
+        for facet, edit in (("year", self.year_edit), ("manuf", self.manuf_edit), ("category", self.category_edit)):
+            completer = QCompleter(QStandardItemModel(self), edit)
+            completer.setCompletionRole(Qt.UserRole)
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            completer.setFilterMode(Qt.MatchContains)
+            completer.popup().setMinimumWidth(220)
+            edit.setCompleter(completer)
+            edit.installEventFilter(self)
+            self.facet_completers[facet] = completer
+
+        self.group_clones_chk = QCheckBox("Group Clones")
+        self.group_clones_chk.setChecked(self.cfg.get("group_clones", False))
+        self.group_clones_chk.toggled.connect(self.toggle_group_clones)
+
         self.roms_list = QListWidget()
         self.roms_list.setMinimumWidth(420)
         self.roms_list.itemDoubleClicked.connect(self.launch_selected_rom)
@@ -737,20 +2464,39 @@ class MainWindow(QMainWindow):
         self.rom_count_label = QLabel()
         self.rom_count_label.setSizePolicy(self.rom_count_label.sizePolicy().horizontalPolicy(), self.rom_count_label.sizePolicy().verticalPolicy())
 
+        self.scrolling_label = QLabel("Scrolling...")
+        self.scrolling_label.setStyleSheet("color: gray;")
+        self.scrolling_label.setVisible(False)
+
+        self.launch_label = QLabel()
+        self.launch_label.setStyleSheet("color: gray;")
         self.settings_btn = QPushButton("Settings")
         self.settings_btn.setMaximumWidth(80)
         self.settings_btn.setMinimumHeight(24)
         self.settings_btn.clicked.connect(self.show_settings)
 
+        self.grid_view_chk = QCheckBox("Grid View")
+        self.grid_view_chk.setChecked(self.cfg.get("grid_view", False))
+        self.grid_view_chk.toggled.connect(self.toggle_grid_view)
+
         self.favorites_btn = QPushButton("Favorites")
         self.favorites_btn.setMaximumWidth(80)
         self.favorites_btn.setMinimumHeight(24)
         self.favorites_btn.clicked.connect(self.show_favorites)
 
+        self.history_btn = QPushButton("History")
+        self.history_btn.setMaximumWidth(80)
+        self.history_btn.setMinimumHeight(24)
+        self.history_btn.clicked.connect(self.show_history)
+
         settings_row = QHBoxLayout()
         settings_row.addWidget(self.rom_count_label)
+        settings_row.addWidget(self.scrolling_label)
+        settings_row.addWidget(self.launch_label)
         settings_row.addStretch(1)
+        settings_row.addWidget(self.grid_view_chk)
         settings_row.addWidget(self.favorites_btn)
+        settings_row.addWidget(self.history_btn)
         settings_row.addWidget(self.settings_btn)
 
         layout = QVBoxLayout()
@@ -759,10 +2505,14 @@ class MainWindow(QMainWindow):
         top_row.addWidget(self.systems_combo)
         top_row.addWidget(QLabel("Search:"))
         top_row.addWidget(self.search_edit)
+        top_row.addWidget(self.all_systems_chk)
         top_row.addWidget(QLabel("Year:"))
         top_row.addWidget(self.year_edit)
         top_row.addWidget(QLabel("Manufacturer:"))
         top_row.addWidget(self.manuf_edit)
+        top_row.addWidget(QLabel("Category:"))
+        top_row.addWidget(self.category_edit)
+        top_row.addWidget(self.group_clones_chk)
         layout.addLayout(top_row)
 
         splitter = QSplitter(Qt.Horizontal)
@@ -780,6 +2530,9 @@ class MainWindow(QMainWindow):
         self.preview_img_label.setScaledContents(False)
         self.img_tabs.addTab(self.title_img_label, "Title")
         self.img_tabs.addTab(self.preview_img_label, "Preview")
+        self.info_text = QPlainTextEdit()
+        self.info_text.setReadOnly(True)
+        self.img_tabs.addTab(self.info_text, "Info")
         splitter.addWidget(self.img_tabs)
 
         splitter.setStretchFactor(0, 3)
@@ -794,7 +2547,57 @@ class MainWindow(QMainWindow):
 
         self.roms = []
         self.rom_cache = {}
-        self.roms_list.currentRowChanged.connect(self.update_image_tabs)
+        self.rom_children = {}
+        self.expanded_parents = set()
+        self.filter_args = ("", "", "")
+        self.category_filter = ""
+        self.row_systems = []
+        self.jump_index = None
+        self.jump_prefix = ""
+        self.jump_prefix_time = 0
+        self.loader_pool = ThreadPoolExecutor(max_workers=4)
+        self.loaded_rom_lists = queue.Queue()
+        self.loading_rom_lists = set()
+        self.loader_timer = QTimer(self)
+        self.loader_timer.timeout.connect(self.drain_loaded_rom_lists)
+        self.thumbnails = None
+        self.update_thumbnail_cache()
+        self.grid_pool = ThreadPoolExecutor(max_workers=2)
+        self.grid_generation = 0
+        self.grid_requests = {}
+        self.grid_results = queue.Queue()
+        self.grid_icons = OrderedDict()
+        self.grid_icon_rows = set()
+        self.memory_budget = MemoryBudget(self.cfg.get("memory_budget_mb", 256) * 1024 * 1024)
+        self.memory_budget.register("rom", self.drop_rom_cache_entry)
+        self.memory_budget.register("grid", lambda key: self.grid_icons.pop(key, None))
+        self.memory_budget.register("meta", drop_metadata_cache_entry)
+        self.grid_update_timer = QTimer(self)
+        self.grid_update_timer.setSingleShot(True)
+        self.grid_update_timer.timeout.connect(self.request_visible_thumbnails)
+        self.grid_results_timer = QTimer(self)
+        self.grid_results_timer.timeout.connect(self.drain_grid_results)
+        self.roms_list.verticalScrollBar().valueChanged.connect(lambda _: self.grid_update_timer.start(30))
+        try:
+            self.history = PlayHistory()
+        except sqlite3.Error as e:
+            print(f"Failed to open play history database: {e}")
+            self.history = None
+        self.move_favorites_storage()
+        self.prefetcher = RomPrefetcher(self.cfg.get("readahead_mb", 256) * 1024 * 1024)
+        self.selection_time = time.perf_counter()
+        self.image_update_timer = QTimer(self)
+        self.image_update_timer.setSingleShot(True)
+        self.image_update_timer.timeout.connect(self.update_image_tabs)
+        self.category_index_pending = False
+        self.metadata_timer = QTimer(self)
+        self.metadata_timer.timeout.connect(self.metadata_indexes_ready)
+        self.video_player = None
+        self.video_timer = QTimer(self)
+        self.video_timer.timeout.connect(self.show_video_frame)
+        self.img_tabs.currentChanged.connect(lambda _: self.update_video_snap())
+        self.roms_list.currentRowChanged.connect(self.schedule_image_update)
+        self.apply_view_mode()
         self.update_rom_list()
 
         pygame.init()
@@ -815,6 +2618,13 @@ class MainWindow(QMainWindow):
         self.timer.start(20)
 
         self.is_fullscreen = False
+        self.quitting = False
+        self.resident_server = None
+        self.update_resident_mode()
+        self.api_server = None
+        self.api_timer = QTimer(self)
+        self.api_timer.timeout.connect(self.drain_api_launches)
+        self.update_api_server()
         self.installEventFilter(self)
         self.roms_list.installEventFilter(self)
 
@@ -837,7 +2647,7 @@ class MainWindow(QMainWindow):
 
     def show_favorites(self):
         if self.favorites_dialog is None:
-            self.favorites_dialog = FavoritesDialog(self.cfg, self, self.current_system)
+            self.favorites_dialog = FavoritesDialog(self.cfg, self, self.current_system, self.history)
             self.favorites_dialog.finished.connect(self.on_favorites_dialog_closed)
             self.favorites_dialog.exec_()
         else:
@@ -846,6 +2656,40 @@ class MainWindow(QMainWindow):
     def on_favorites_dialog_closed(self):
         self.favorites_dialog = None
 
+    def show_history(self):
+        if self.history is None:
+            QMessageBox.critical(self, "Error", "Play history database is not available.")
+            return
+        if self.history_dialog is None:
+            self.history_dialog = HistoryDialog(self.cfg, self.history, self)
+            self.history_dialog.finished.connect(self.on_history_dialog_closed)
+            self.history_dialog.exec_()
+        else:
+            self.history_dialog.close()
+
+    def on_history_dialog_closed(self):
+        self.history_dialog = None
+
+    def favorites_in_database(self):
+        return self.history is not None and self.cfg.get("favorites_in_database", False)
+
+    def move_favorites_storage(self):
+        # Favorites live either in config.json or in the database; move them over when the option changes
+        if self.history is None:
+            return
+        if self.cfg.get("favorites_in_database", False):
+            if self.cfg["favorites"]:
+                for favorite in self.cfg["favorites"]:
+                    self.history.add_favorite(*favorite)
+                self.cfg["favorites"] = []
+                save_config(self.cfg)
+        else:
+            favorites = self.history.favorites()
+            if favorites:
+                self.cfg["favorites"].extend(fav for fav in favorites if fav not in self.cfg["favorites"])
+                self.history.replace_favorites([])
+                save_config(self.cfg)
+
     def show_context_menu(self, position):
         idx = self.roms_list.currentRow()
         if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
@@ -853,17 +2697,26 @@ class MainWindow(QMainWindow):
 
         menu = QMenu()
         add_to_favorites = menu.addAction("Add to Favorites")
+        toggle_clones = None
+        parent_idx = self.clone_parent_row(idx)
+        if self.group_clones_chk.isChecked() and self.rom_children.get(self.roms[parent_idx][0]):
+            expanded = self.roms[parent_idx][0] in self.expanded_parents
+            toggle_clones = menu.addAction("Collapse Clones" if expanded else "Expand Clones")
         action = menu.exec_(self.roms_list.mapToGlobal(position))
 
         if action == add_to_favorites:
             self.add_to_favorites(idx)
+        elif toggle_clones is not None and action == toggle_clones:
+            self.toggle_clones(idx)
 
     def add_to_favorites(self, idx):
-        sys_cfg, _ = self.current_system()
-        sys_name = sys_cfg["name"]
+        sys_name = self.row_system_name(idx)
         rom, title, year, manuf = self.roms[idx]
         favorite = (sys_name, rom, title, year, manuf)
-        if favorite not in self.cfg["favorites"]:
+        if self.favorites_in_database():
+            if self.history.add_favorite(*favorite):
+                QMessageBox.information(self, "Favorites", f"Added '{title}' to favorites.")
+        elif favorite not in self.cfg["favorites"]:
             self.cfg["favorites"].append(favorite)
             save_config(self.cfg)
             QMessageBox.information(self, "Favorites", f"Added '{title}' to favorites.")
@@ -871,8 +2724,18 @@ class MainWindow(QMainWindow):
     def eventFilter(self, obj, event):
         if event.type() == event.WindowActivate:
             self.is_active = True
+            if self.video_player is None:
+                self.update_video_snap()
         elif event.type() == event.WindowDeactivate:
             self.is_active = False
+            self.stop_video_snap()
+        if event.type() == event.KeyPress and obj in (self.year_edit, self.manuf_edit, self.category_edit):
+            if event.key() == Qt.Key_Down and not obj.completer().popup().isVisible():
+                obj.completer().setCompletionPrefix(obj.text())
+                obj.completer().complete()
+                return True
+        if event.type() == event.Resize and obj == self.roms_list:
+            self.grid_update_timer.start(30)
         if event.type() == event.KeyPress and obj == self.roms_list:
             if event.key() in (Qt.Key_Return, Qt.Key_Enter):
                 self.launch_selected_rom()
@@ -880,9 +2743,28 @@ class MainWindow(QMainWindow):
             if event.key() == Qt.Key_F11:
                 self.toggle_fullscreen()
                 return True
+            if event.key() == Qt.Key_F12:
+                self.show_memory_usage()
+                return True
+            if event.key() in (Qt.Key_Plus, Qt.Key_Minus) and self.group_clones_chk.isChecked():
+                idx = self.clone_parent_row(self.roms_list.currentRow())
+                if 0 <= idx < len(self.roms) and (self.roms[idx][0] in self.expanded_parents) == (event.key() == Qt.Key_Minus):
+                    self.toggle_clones(idx)
+                return True
             if event.key() == Qt.Key_Tab and not isinstance(self.focusWidget(), QLineEdit):
                 self.show_about()
                 return True
+            if event.key() in (Qt.Key_Left, Qt.Key_Right) and event.modifiers() & Qt.ControlModifier:
+                self.jump_to_letter(-1 if event.key() == Qt.Key_Left else 1)
+                return True
+            if event.text().isalnum() and not event.modifiers() & (Qt.ControlModifier | Qt.AltModifier):
+                now = time.time() * 1000
+                if now - self.jump_prefix_time > 1000:
+                    self.jump_prefix = ""
+                self.jump_prefix += event.text()
+                self.jump_prefix_time = now
+                self.jump_to_prefix(self.jump_prefix)
+                return True
             if event.key() == Qt.Key_Left:
                 self.last_key_held["left"] = True
                 self.last_key_held_time["left"] = time.time() * 1000
@@ -908,31 +2790,152 @@ class MainWindow(QMainWindow):
             self.showFullScreen()
             self.is_fullscreen = True
 
+    def schedule_image_update(self):
+        """Coalesce selection changes so images only load once the selection has settled."""
+        self.selection_time = time.perf_counter()
+        self.stop_video_snap()
+        delay = self.cfg["joystick_config"].get("image_settle_delay", 0.15)
+        if delay <= 0:
+            self.update_image_tabs()
+            return
+        self.scrolling_label.setVisible(True)
+        self.image_update_timer.start(int(delay * 1000))
+
     def update_image_tabs(self):
+        self.image_update_timer.stop()
+        self.scrolling_label.setVisible(False)
         idx = self.roms_list.currentRow()
         if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
             self.title_img_label.setPixmap(None)
             self.preview_img_label.setPixmap(None)
+            self.info_text.clear()
+            self.prefetcher.cancel()
+            self.stop_video_snap()
             return
         rom = self.roms[idx][0]
-        sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
+        sys_name = self.row_system_name(idx)
+        # The selection has settled: warm the page cache in case this ROM gets launched
+        self.prefetcher.limit = self.cfg.get("readahead_mb", 256) * 1024 * 1024
+        self.prefetcher.prefetch(os.path.join(self.cfg["roms_dirs"].get(sys_name, ""), rom))
         prefix = self.SYSTEM_IMAGE_PREFIXES.get(sys_name, "")
         base_name = Path(rom).stem.lower()
         title_filename = f"{prefix}{base_name}.png"
         preview_filename = f"{prefix}{base_name}.png"
         title_dir = self.cfg["title_image_dirs"].get(sys_name, "")
         preview_dir = self.cfg["preview_image_dirs"].get(sys_name, "")
-        title_path = find_file_case_insensitive(title_dir, title_filename) if title_dir else None
-        preview_path = find_file_case_insensitive(preview_dir, preview_filename) if preview_dir else None
-        if title_path:
-            self.title_img_label.setPixmap(QPixmap(title_path))
-        else:
-            self.title_img_label.setPixmap(None)
-        if preview_path:
-            self.preview_img_label.setPixmap(QPixmap(preview_path))
+        self.title_img_label.setPixmap(self.load_image(title_dir, title_filename))
+        self.preview_img_label.setPixmap(self.load_image(preview_dir, preview_filename))
+        self.info_text.setPlainText(self.rom_info(sys_name, rom))
+        self.update_video_snap()
+
+    def update_video_snap(self):
+        """(Re)start the selected ROM's video snap when the Preview tab is showing, otherwise stop it."""
+        self.stop_video_snap()
+        if cv2 is None or not self.cfg.get("video_snaps", True) or not self.is_active:
+            return
+        if not self.img_tabs.isVisible() or self.img_tabs.currentWidget() is not self.preview_img_label:
+            return
+        idx = self.roms_list.currentRow()
+        if idx < 0 or idx >= len(self.roms) or self.image_update_timer.isActive():
+            return
+        sys_name = self.row_system_name(idx)
+        prefix = self.SYSTEM_IMAGE_PREFIXES.get(sys_name, "")
+        preview_dir = self.cfg["preview_image_dirs"].get(sys_name, "")
+        filename = f"{prefix}{Path(self.roms[idx][0]).stem.lower()}.mp4"
+        if is_image_archive(preview_dir):
+            found = get_image_archive(preview_dir)
+            if not found or filename not in found[1]:
+                return
+            filename = Path(found[1][filename].filename).name
         else:
-            self.preview_img_label.setPixmap(None)
+            path = find_file_cached(preview_dir, filename)
+            if not path:
+                return
+            filename = os.path.basename(path)
+        size = self.img_tabs.size()
+        self.video_player = VideoSnapPlayer(preview_dir, filename, min(size.width(), 640), min(size.height(), 480))
+        self.video_timer.start(33)
+
+    def show_video_frame(self):
+        player = self.video_player
+        if player is None:
+            self.video_timer.stop()
+            return
+        if player.fps and self.video_timer.interval() != int(1000 / player.fps):
+            self.video_timer.setInterval(int(1000 / player.fps))
+        frame = player.next_frame()
+        if frame is not None:
+            self.preview_img_label.setPixmap(QPixmap.fromImage(frame))
+
+    def stop_video_snap(self):
+        self.video_timer.stop()
+        if self.video_player:
+            self.video_player.stop()
+            self.video_player = None
+
+    def metadata_index(self, files_key, sys_name, kind):
+        path = self.cfg[files_key].get(sys_name, "")
+        index = get_metadata_index(path, kind)
+        if index is None and metadata_indexes_pending(path):
+            # The category filter, its counts and completer all wait for this index
+            self.category_index_pending |= kind == "category"
+            if not self.metadata_timer.isActive():
+                self.metadata_timer.start(200)
+        return index
+
+    def metadata_indexes_ready(self):
+        """Show what the history/category indexes finished in the background could not show before."""
+        if metadata_indexes_pending():
+            return
+        self.metadata_timer.stop()
+        if self.category_index_pending:
+            self.category_index_pending = False
+            self.update_rom_list()
+            return
+        idx = self.roms_list.currentRow()
+        if 0 <= idx < len(self.roms) and not self.image_update_timer.isActive():
+            self.info_text.setPlainText(self.rom_info(self.row_system_name(idx), self.roms[idx][0]))
+
+    def category_facet(self, sys_name, rom_list, cache_key, children=None):
+        index = self.metadata_index("category_files", sys_name, "category")
+        return get_category_facet_cached(rom_list, cache_key, index, self.rom_cache, children) if index else None
+
+    def rom_info(self, sys_name, rom):
+        """Category and history text of a ROM, read from the indexed history/category files."""
+        name = Path(rom).stem
+        lines = []
+        categories = self.metadata_index("category_files", sys_name, "category")
+        category = categories.get(name) if categories else ""
+        if category:
+            lines.append(f"Category: {category}")
+        history = self.metadata_index("history_files", sys_name, "history")
+        text = history.get(name) if history else ""
+        if text:
+            lines.append(text)
+        return "\n\n".join(lines) if lines else "No information available."
+
+    def load_image(self, image_dir, filename):
+        """Load an image from the thumbnail pack, falling back to the image folder itself."""
+        if not image_dir:
+            return None
+        pixmap = QPixmap()
+        data = self.thumbnails.get(image_dir, filename) if self.thumbnails else None
+        if data and pixmap.loadFromData(data):
+            return pixmap
+        data = read_image_file(image_dir, filename)
+        return pixmap if data and pixmap.loadFromData(data) else None
+
+    def update_thumbnail_cache(self):
+        if not self.cfg.get("thumbnail_cache", True):
+            if self.thumbnails:
+                self.thumbnails.close()
+                self.thumbnails = None
+            return
+        if self.thumbnails is None:
+            self.thumbnails = ThumbnailCache()
+        self.thumbnails.build(
+            list(self.cfg["title_image_dirs"].values()) + list(self.cfg["preview_image_dirs"].values())
+        )
 
     def current_system(self):
         idx = self.systems_combo.currentIndex()
@@ -940,58 +2943,624 @@ class MainWindow(QMainWindow):
         roms_dir = self.cfg["roms_dirs"].get(sys_cfg["name"], "")
         return sys_cfg, roms_dir
 
+    def row_system_name(self, idx):
+        if self.all_systems_chk.isChecked():
+            return self.row_systems[idx]
+        return self.current_system()[0]["name"]
+
+    def rom_list_args(self, sys_cfg):
+        sys_name = sys_cfg["name"]
+        return (
+            sys_cfg["rom_titles_file"],
+            self.cfg["roms_dirs"].get(sys_name, ""),
+            sys_name,
+            self.cfg["xml_dat_files"].get(sys_name, "")
+        )
+
+    def load_rom_list_in_background(self, args):
+        if args in self.loading_rom_lists:
+            return
+        self.loading_rom_lists.add(args)
+        future = self.loader_pool.submit(load_rom_list_worker, *args, self.rom_cache)
+        future.add_done_callback(lambda _, args=args: self.loaded_rom_lists.put(args))
+        if not self.loader_timer.isActive():
+            self.loader_timer.start(50)
+
+    def drain_loaded_rom_lists(self):
+        loaded = False
+        while True:
+            try:
+                args = self.loaded_rom_lists.get_nowait()
+            except queue.Empty:
+                break
+            self.loading_rom_lists.discard(args)
+            loaded = True
+        if not self.loading_rom_lists:
+            self.loader_timer.stop()
+        if loaded and self.all_systems_chk.isChecked():
+            self.update_global_rom_list()
+
+    def update_global_rom_list(self):
+        """Merge the current search over every system's cached list, loading missing lists in the background."""
+        search, year_filter, manuf_filter = self.filter_args
+        selected = None
+        idx = self.roms_list.currentRow()
+        if 0 <= idx < len(self.roms) and idx < len(self.row_systems):
+            selected = (self.row_systems[idx], self.roms[idx][0])
+        results = []
+        year_counts, manuf_counts, category_counts = {}, {}, {}
+        for sys_cfg in TAB_CONFIGS:
+            args = self.rom_list_args(sys_cfg)
+            cache_key = args[1:]
+            all_roms = self.rom_cache.get(cache_key)
+            if all_roms is None:
+                self.load_rom_list_in_background(args)
+                continue
+            facets = get_facet_index_cached(all_roms, cache_key, self.rom_cache)
+            categories = self.category_facet(sys_cfg["name"], all_roms, cache_key)
+            found, years, manufs, cats = facet_filter_rom_list(
+                all_roms, facets, search, year_filter, manuf_filter, categories, self.category_filter
+            )
+            results.append([(record[1].lower(), sys_cfg["name"], record) for record in found])
+            for counts, system_counts in ((year_counts, years), (manuf_counts, manufs), (category_counts, cats)):
+                for value, count in system_counts.items():
+                    counts[value] = counts.get(value, 0) + count
+        merged = list(heapq.merge(*results, key=lambda row: row[0]))
+        self.roms = [record for _, _, record in merged]
+        self.row_systems = [sys_name for _, sys_name, _ in merged]
+        self.update_facet_completer("year", year_counts, key=lambda item: item[0])
+        self.update_facet_completer("manuf", manuf_counts, key=lambda item: item[0].lower())
+        self.update_facet_completer("category", category_counts, key=lambda item: item[0].lower())
+        self.reset_grid_thumbnails()
+        self.roms_list.blockSignals(True)
+        self.roms_list.clear()
+        new_idx = -1
+        for row, (record, sys_name) in enumerate(zip(self.roms, self.row_systems)):
+            self.roms_list.addItem(f"{self.format_rom_display(record)} [{sys_name}]")
+            if selected == (sys_name, record[0]):
+                new_idx = row
+        count = len(self.roms)
+        text = f"ROMs found: {count} ({len(results)}/{len(TAB_CONFIGS)} systems searched)"
+        if self.loading_rom_lists:
+            text += f" (loading {len(self.loading_rom_lists)} more...)"
+        self.rom_count_label.setText(text)
+        if not self.roms_list.count():
+            self.roms_list.addItem("No ROMs found.")
+        self.roms_list.setCurrentRow(new_idx)
+        self.roms_list.blockSignals(False)
+        if selected is None or new_idx < 0:
+            self.update_image_tabs()
+        self.enforce_memory_budget()
+
     def update_rom_list(self):
         sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
-        roms_dir = self.cfg["roms_dirs"].get(sys_name, "")
-        rom_titles_file = sys_cfg["rom_titles_file"]
+        rom_titles_file, roms_dir, sys_name, xml_file = self.rom_list_args(sys_cfg)
         search = self.search_edit.text().lower()
-        xml_file = self.cfg["xml_dat_files"].get(sys_name, "")
         year_filter = self.year_edit.text().strip()
         manuf_filter = self.manuf_edit.text().strip()
-        all_roms = get_rom_list_cached(
-            rom_titles_file, roms_dir, sys_name, xml_file, self.rom_cache
+        self.filter_args = (search, year_filter, manuf_filter)
+        self.category_filter = self.category_edit.text().strip()
+        self.expanded_parents = set()
+        if self.all_systems_chk.isChecked():
+            self.rom_children = {}
+            self.update_global_rom_list()
+            return
+        cache_key = (roms_dir, sys_name, xml_file)
+        if self.group_clones_chk.isChecked():
+            all_roms, self.rom_children = get_rom_groups_cached(
+                rom_titles_file, roms_dir, sys_name, xml_file, self.rom_cache
+            )
+            cache_key += ("groups",)
+        else:
+            all_roms = get_rom_list_cached(
+                rom_titles_file, roms_dir, sys_name, xml_file, self.rom_cache
+            )
+            self.rom_children = {}
+        facets = get_facet_index_cached(all_roms, cache_key, self.rom_cache, self.rom_children)
+        categories = self.category_facet(sys_name, all_roms, cache_key, self.rom_children)
+        found, year_counts, manuf_counts, category_counts = facet_filter_rom_list(
+            all_roms, facets, search, year_filter, manuf_filter, categories, self.category_filter
         )
-        self.roms = filter_rom_list(all_roms, search, year_filter, manuf_filter)
+        self.update_facet_completer("year", year_counts, key=lambda item: item[0])
+        self.update_facet_completer("manuf", manuf_counts, key=lambda item: item[0].lower())
+        self.update_facet_completer("category", category_counts, key=lambda item: item[0].lower())
+        self.reset_grid_thumbnails()
         self.roms_list.clear()
-        for _, title, year, manuf in self.roms:
-            display = title
-            if year or manuf:
-                display += f" [{year}]" if year else ""
-                display += f" ({manuf})" if manuf else ""
-            self.roms_list.addItem(display)
-        count = len(self.roms)
-        self.rom_count_label.setText(f"ROMs found: {count}")
+        self.roms = []
+        filtering = any(self.filter_args) or self.category_filter
+        count = clones = 0
+        for record in found:
+            matching = self.rom_children.get(record[0], [])
+            own_match = True
+            if filtering and self.rom_children:
+                # Parent rows also match through their clones; only clones that match count and show
+                matching = self.filter_clones(matching)
+                own_match = bool(self.filter_clones([record]))
+                if not own_match and not matching:
+                    continue
+            count += 1
+            clones += len(matching)
+            self.roms.append(record)
+            if not own_match:
+                self.expanded_parents.add(record[0])
+            self.roms_list.addItem(self.format_rom_display(record))
+            if not own_match:
+                for clone in matching:
+                    item = QListWidgetItem(self.format_rom_display(clone, is_clone=True))
+                    item.setData(Qt.UserRole, True)
+                    self.roms_list.addItem(item)
+                self.roms.extend(matching)
+        if self.rom_children:
+            self.rom_count_label.setText(f"ROMs found: {count} (+{clones} clones)")
+        else:
+            self.rom_count_label.setText(f"ROMs found: {count}")
         if not self.roms_list.count():
             self.roms_list.addItem("No ROMs found.")
         self.update_image_tabs()
+        self.enforce_memory_budget()
+
+    def get_jump_index(self):
+        """Jump index over the top-level rows of the current view, rebuilt after the view changes."""
+        if self.jump_index is None:
+            rows = [
+                row for row in range(len(self.roms))
+                if not self.roms_list.item(row).data(Qt.UserRole)
+            ]
+            self.jump_index = build_jump_index((self.roms[row][1] for row in rows), rows)
+        return self.jump_index
+
+    def jump_to_letter(self, direction):
+        row = jump_index_row(self.get_jump_index(), self.roms_list.currentRow(), direction=direction)
+        if row is not None:
+            self.roms_list.setCurrentRow(row)
+
+    def jump_to_prefix(self, prefix):
+        row = jump_index_row(self.get_jump_index(), self.roms_list.currentRow(), prefix=prefix)
+        if row is not None:
+            self.roms_list.setCurrentRow(row)
+
+    def drop_rom_cache_entry(self, key):
+        layer, entry_key = key
+        with ROM_CACHE_LOCK:
+            if layer is None:
+                # Parents, groups and their search indexes are built from each other, so they go together
+                base = entry_key[:3]
+                dropped = [k for k in self.rom_cache if len(k) > 3 and k[:3] == base]
+            else:
+                self.rom_cache.get(("__layer__", layer), {}).pop(entry_key, None)
+                # The top-level list and everything derived from it go with the merged layer
+                dropped = [k for k in self.rom_cache if k[:3] == entry_key] if layer == "merge" else []
+            for derived in dropped:
+                del self.rom_cache[derived]
+        for derived in dropped:
+            self.memory_budget.discard("rom", (None, derived))
+
+    def enforce_memory_budget(self):
+        """Account new cache entries, then evict least recently used ones beyond the budget."""
+        budget = self.memory_budget
+        budget.limit = self.cfg.get("memory_budget_mb", 256) * 1024 * 1024
+        # Every list on screen is pinned: the current system, or all of them in All Systems mode
+        shown = TAB_CONFIGS if self.all_systems_chk.isChecked() else [self.current_system()[0]]
+        bases = set()
+        pinned = set()
+        for sys_cfg in shown:
+            titles_file, roms_dir, sys_name, xml_file = self.rom_list_args(sys_cfg)
+            base = (roms_dir, sys_name, xml_file)
+            bases.add(base)
+            pinned |= {
+                ("rom", ("dat", xml_file)), ("rom", ("titles", titles_file)),
+                ("rom", ("scan", (roms_dir, sys_name))), ("rom", ("merge", base))
+            }
+            # So are its history/category indexes and image folder listings
+            for files_key in ("history_files", "category_files", "title_image_dirs", "preview_image_dirs"):
+                path = self.cfg[files_key].get(sys_name, "")
+                pinned |= {("meta", ("index", path)), ("meta", ("listing", path)), ("meta", ("archive", path))}
+        present = set()
+        with ROM_CACHE_LOCK:
+            # Loader and API threads add entries concurrently; account a snapshot
+            entries = [
+                (key, list(value.items()) if key[0] == "__layer__" else value)
+                for key, value in self.rom_cache.items()
+            ]
+        for key, value in entries:
+            if key[0] == "__layer__":
+                label = "ROM lists" if key[1] == "merge" else "Metadata layers"
+                for entry_key, (_, entry_value) in value:
+                    budget.account("rom", (key[1], entry_key), label, entry_value)
+                    present.add((key[1], entry_key))
+            elif len(key) > 3:
+                # Plain (roms_dir, system, xml) keys alias the merged layer and are not counted twice
+                label = "Search indexes" if key[-1] in ("facets", "categories") else "ROM lists"
+                budget.account("rom", (None, key), label, value)
+                present.add((None, key))
+                if key[:3] in bases:
+                    pinned.add(("rom", (None, key)))
+        budget.forget("rom", present)
+        budget.forget("grid", set(self.grid_icons))
+        present = set()
+        with METADATA_INDEXES_LOCK:
+            indexes = list(METADATA_INDEXES.items())
+        for path, index in indexes:
+            budget.account("meta", ("index", path), "Metadata indexes", index.entries)
+            present.add(("index", path))
+        for path, listing in list(DIR_LISTINGS.items()):
+            budget.account("meta", ("listing", path), "Image folder listings", listing)
+            present.add(("listing", path))
+        with IMAGE_ARCHIVES_LOCK:
+            archives = list(IMAGE_ARCHIVES.items())
+        for path, cached in archives:
+            budget.account("meta", ("archive", path), "Image folder listings", cached[1][1])
+            present.add(("archive", path))
+        budget.forget("meta", present)
+        for entry_key in pinned:
+            budget.touch(*entry_key)
+        budget.evict(pinned)
+
+    def memory_report(self):
+        self.enforce_memory_budget()
+        lines = []
+        for label, size in sorted(self.memory_budget.usage().items()):
+            lines.append(f"{label}: {size / 1048576:.1f} MB")
+        lines.append(
+            f"Total cached: {self.memory_budget.total() / 1048576:.1f} MB "
+            f"of {self.memory_budget.limit / 1048576:.0f} MB budget"
+        )
+        shown = sum(
+            label._pixmap.width() * label._pixmap.height() * 4
+            for label in (self.title_img_label, self.preview_img_label) if label._pixmap
+        )
+        lines.append(f"Displayed images: {shown / 1048576:.1f} MB")
+        if self.thumbnails:
+            count = sum(len(entries) for entries in self.thumbnails.index.values())
+            lines.append(f"Thumbnail pack index: {count} images, {estimate_size(self.thumbnails.index) / 1048576:.1f} MB")
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"tracemalloc: {current / 1048576:.1f} MB current, {peak / 1048576:.1f} MB peak")
+        return "\n".join(lines)
+
+    def show_memory_usage(self):
+        MemoryDialog(self.memory_report, self).exec_()
+
+    def toggle_grid_view(self, checked):
+        self.cfg["grid_view"] = checked
+        save_config(self.cfg)
+        self.apply_view_mode()
+
+    def apply_view_mode(self):
+        self.reset_grid_thumbnails()
+        if self.grid_view_chk.isChecked():
+            self.roms_list.setViewMode(QListView.IconMode)
+            self.roms_list.setIconSize(QSize(*self.GRID_ICON_SIZE))
+            self.roms_list.setGridSize(QSize(self.GRID_ICON_SIZE[0] + 24, self.GRID_ICON_SIZE[1] + 48))
+            self.roms_list.setResizeMode(QListView.Adjust)
+            self.roms_list.setMovement(QListView.Static)
+            self.roms_list.setUniformItemSizes(True)
+            self.roms_list.setWordWrap(True)
+        else:
+            self.roms_list.setViewMode(QListView.ListMode)
+            self.roms_list.setIconSize(QSize())
+            self.roms_list.setGridSize(QSize())
+            self.roms_list.setUniformItemSizes(False)
+            self.roms_list.setWordWrap(False)
+            self.grid_icons.clear()
+
+    def reset_grid_thumbnails(self):
+        """Drop every cell icon and pending request before the rows are rebuilt or shifted."""
+        self.jump_index = None
+        self.grid_generation += 1
+        for future in self.grid_requests.values():
+            future.cancel()
+        self.grid_requests.clear()
+        for row in self.grid_icon_rows:
+            item = self.roms_list.item(row)
+            if item is not None:
+                item.setIcon(QIcon())
+        self.grid_icon_rows.clear()
+        self.grid_update_timer.start(30)
+
+    def visible_grid_rows(self):
+        """Return the range of rows on screen plus one screen of look-ahead on either side."""
+        count = len(self.roms)
+        viewport = self.roms_list.viewport().rect()
+        grid = self.roms_list.gridSize()
+        columns = max(1, viewport.width() // max(1, grid.width()))
+        # indexAt() misses at cell corners (items are centred in their cells); the grid scrolls per pixel
+        first = self.roms_list.verticalScrollBar().value() // max(1, grid.height()) * columns
+        screen = columns * (viewport.height() // max(1, grid.height()) + 2)
+        return range(max(0, first - screen), min(count, first + 2 * screen))
+
+    def request_visible_thumbnails(self):
+        if not self.grid_view_chk.isChecked() or not self.roms:
+            return
+        visible = self.visible_grid_rows()
+        for row in list(self.grid_requests):
+            if row not in visible:
+                self.grid_requests.pop(row).cancel()
+        for row in list(self.grid_icon_rows):
+            if row not in visible:
+                self.grid_icon_rows.discard(row)
+                self.roms_list.item(row).setIcon(QIcon())
+        for row in visible:
+            if row in self.grid_icon_rows or row in self.grid_requests:
+                continue
+            sys_name = self.row_system_name(row)
+            rom = self.roms[row][0]
+            key = (sys_name, rom)
+            icon = self.grid_icons.get(key)
+            if icon is not None:
+                self.grid_icons.move_to_end(key)
+                self.memory_budget.touch("grid", key)
+                self.roms_list.item(row).setIcon(icon)
+                self.grid_icon_rows.add(row)
+                continue
+            prefix = self.SYSTEM_IMAGE_PREFIXES.get(sys_name, "")
+            filename = f"{prefix}{Path(rom).stem.lower()}.png"
+            image_dir = self.cfg["title_image_dirs"].get(sys_name, "") or self.cfg["preview_image_dirs"].get(sys_name, "")
+            if not image_dir:
+                continue
+            future = self.grid_pool.submit(load_grid_image, self.thumbnails, image_dir, filename, *self.GRID_ICON_SIZE)
+            generation = self.grid_generation
+            future.add_done_callback(lambda f, row=row, key=key: self.grid_results.put((generation, row, key, f)))
+            self.grid_requests[row] = future
+        if self.grid_requests and not self.grid_results_timer.isActive():
+            self.grid_results_timer.start(30)
+
+    def drain_grid_results(self):
+        while True:
+            try:
+                generation, row, key, future = self.grid_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.grid_generation or self.grid_requests.get(row) is not future:
+                continue
+            del self.grid_requests[row]
+            image = None if future.cancelled() or future.exception() else future.result()
+            if image is None or image.isNull():
+                continue
+            icon = QIcon(QPixmap.fromImage(image))
+            self.grid_icons[key] = icon
+            self.memory_budget.account("grid", key, "Grid thumbnails", icon, size=image.sizeInBytes())
+            while len(self.grid_icons) > self.GRID_ICON_CACHE:
+                self.memory_budget.discard("grid", self.grid_icons.popitem(last=False)[0])
+            self.roms_list.item(row).setIcon(icon)
+            self.grid_icon_rows.add(row)
+        if not self.grid_requests:
+            self.grid_results_timer.stop()
+
+    def update_facet_completer(self, facet, counts, key):
+        """Refresh a year/manufacturer/category completer, only when its value counts actually changed."""
+        if counts == self.facet_counts[facet]:
+            return
+        self.facet_counts[facet] = counts
+        model = self.facet_completers[facet].model()
+        model.clear()
+        for value, count in sorted(counts.items(), key=key):
+            item = QStandardItem(f"{value} ({count})")
+            item.setData(value, Qt.UserRole)
+            model.appendRow(item)
+
+    def format_rom_display(self, record, is_clone=False):
+        rom, title, year, manuf = record
+        display = title
+        if year or manuf:
+            display += f" [{year}]" if year else ""
+            display += f" ({manuf})" if manuf else ""
+        if is_clone:
+            return "      " + display
+        clones = self.rom_children.get(rom)
+        if clones:
+            marker = "[-]" if rom in self.expanded_parents else "[+]"
+            display = f"{marker} {display} +{len(clones)}"
+        return display
+
+    def toggle_group_clones(self, checked):
+        self.cfg["group_clones"] = checked
+        save_config(self.cfg)
+        self.update_rom_list()
+
+    def clone_parent_row(self, idx):
+        """Return the row of the parent set for a clone row, or idx itself for top-level rows."""
+        while idx > 0 and self.roms_list.item(idx).data(Qt.UserRole):
+            idx -= 1
+        return idx
+
+    def toggle_clones(self, idx):
+        """Materialize or remove the clone rows below the parent at (or above) row idx."""
+        if idx < 0 or idx >= len(self.roms):
+            return
+        idx = self.clone_parent_row(idx)
+        record = self.roms[idx]
+        clones = self.rom_children.get(record[0])
+        if not clones:
+            return
+        self.reset_grid_thumbnails()
+        if record[0] in self.expanded_parents:
+            self.expanded_parents.discard(record[0])
+            end = idx + 1
+            while end < len(self.roms) and self.roms_list.item(end).data(Qt.UserRole):
+                end += 1
+            for row in range(end - 1, idx, -1):
+                self.roms_list.takeItem(row)
+            del self.roms[idx + 1:end]
+        else:
+            self.expanded_parents.add(record[0])
+            clones = self.filter_clones(clones)
+            for offset, clone in enumerate(clones, start=1):
+                item = QListWidgetItem(self.format_rom_display(clone, is_clone=True))
+                item.setData(Qt.UserRole, True)
+                self.roms_list.insertItem(idx + offset, item)
+            self.roms[idx + 1:idx + 1] = clones
+        self.roms_list.item(idx).setText(self.format_rom_display(record))
+        self.roms_list.setCurrentRow(idx)
+
+    def filter_clones(self, clones):
+        """Apply the current search, year, manufacturer and category filters to clone records."""
+        clones = filter_rom_list(clones, *self.filter_args)
+        if self.category_filter:
+            index = self.metadata_index("category_files", self.current_system()[0]["name"], "category")
+            clones = [
+                clone for clone in clones
+                if index and self.category_filter.lower() in index.get(Path(clone[0]).stem).lower()
+            ]
+        return clones
 
     def launch_selected_rom(self, *args):
         idx = self.roms_list.currentRow()
         if idx < 0 or not self.roms or self.roms_list.item(idx).text() == "No ROMs found.":
             QMessageBox.critical(self, "Warning", "Select a ROM.")
             return
-        rom = self.roms[idx][0]
-        sys_cfg = self.current_system()[0]
-        sys_name = sys_cfg["name"]
-        run_rom(rom, self.cfg["roms_dirs"].get(sys_name, ""), self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], sys_name, self)
+        rom, title, year, manuf = self.roms[idx]
+        sys_name = self.row_system_name(idx)
+        roms_dir = self.cfg["roms_dirs"].get(sys_name, "")
+        start = time.perf_counter()
+        if run_rom(
+            rom, roms_dir, self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"], sys_name, self,
+            history=self.history, meta=(title, year, manuf)
+        ):
+            self.report_launch_latency(os.path.join(roms_dir, rom), start)
+
+    def report_launch_latency(self, rom_path, start):
+        now = time.perf_counter()
+        warm = " (ROM pre-read)" if self.prefetcher.done_path == rom_path else ""
+        text = (
+            f"Last launch: {(now - start) * 1000:.0f} ms to start RetroArch, "
+            f"{now - self.selection_time:.1f} s after selection{warm}"
+        )
+        self.launch_label.setText(text)
 
     def show_settings(self):
+        roms_dirs = dict(self.cfg["roms_dirs"])
         dlg = SettingsDialog(
             self.cfg,
             self,
             self.current_system,
             self.clear_rom_cache_and_update,
-            self.update_rom_list
+            self.update_rom_list,
+            self.rescan_rom_folders
         )
         if dlg.exec_():
             self.img_tabs.setVisible(not self.cfg.get("display_only_rom_list", False))
-            self.update_rom_list()
-
-    def clear_rom_cache_and_update(self):
-        self.rom_cache.clear()
+            self.update_thumbnail_cache()
+            self.update_resident_mode()
+            self.update_api_server()
+            self.move_favorites_storage()
+            # A folder picked again may have changed since it was last listed
+            changed = {
+                (roms_dir, sys_name) for sys_name, roms_dir in self.cfg["roms_dirs"].items()
+                if roms_dir != roms_dirs.get(sys_name)
+            }
+            self.clear_rom_cache_and_update(rescan=changed)
+
+    def clear_rom_cache_and_update(self, rescan=None):
+        invalidate_rom_cache(self.rom_cache, rescan)
         self.update_rom_list()
 
+    def rescan_rom_folders(self):
+        self.clear_rom_cache_and_update(rescan={self.rom_list_args(c)[1:3] for c in TAB_CONFIGS})
+
+    def update_resident_mode(self):
+        if not self.cfg.get("resident_mode", False):
+            if self.resident_server:
+                self.resident_server.close()
+                self.resident_server = None
+                QApplication.instance().setQuitOnLastWindowClosed(True)
+            return
+        if self.resident_server:
+            return
+        server = QLocalServer(self)
+        name = resident_server_name()
+        if not server.listen(name):
+            if resident_instance_running():
+                print("Resident mode is already active in another instance")
+                return
+            # A crashed instance can leave a stale socket file behind
+            QLocalServer.removeServer(name)
+            if not server.listen(name):
+                print(f"Failed to start resident mode: {server.errorString()}")
+                return
+        server.newConnection.connect(self.accept_resident_connection)
+        self.resident_server = server
+        # The window is only hidden, so closing a message box while it is hidden must not quit
+        QApplication.instance().setQuitOnLastWindowClosed(False)
+
+    def update_api_server(self):
+        address = (self.cfg.get("api_host", "127.0.0.1"), self.cfg.get("api_port", 8780))
+        if self.api_server and (not self.cfg.get("api_server", False) or self.api_server.address != address):
+            self.api_server.stop()
+            self.api_server = None
+            self.api_timer.stop()
+        if self.api_server or not self.cfg.get("api_server", False):
+            return
+        try:
+            self.api_server = ApiServer(self, *address)
+        except OSError as e:
+            print(f"Failed to start API server on {address[0]}:{address[1]}: {e}")
+            return
+        self.api_timer.start(100)
+
+    def drain_api_launches(self):
+        while self.api_server:
+            try:
+                sys_name, (rom, title, year, manuf) = self.api_server.launches.get_nowait()
+            except queue.Empty:
+                break
+            run_rom(
+                rom, self.cfg["roms_dirs"].get(sys_name, ""), self.cfg["RETROARCH"], self.cfg["RETROARCH_CORE"],
+                sys_name, self, history=self.history, meta=(title, year, manuf)
+            )
+
+    def accept_resident_connection(self):
+        while self.resident_server and self.resident_server.hasPendingConnections():
+            socket = self.resident_server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_resident_message(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            self.read_resident_message(socket)
+
+    def read_resident_message(self, socket):
+        while socket.canReadLine():
+            try:
+                argv = json.loads(bytes(socket.readLine()).decode("utf-8"))
+            except ValueError:
+                continue
+            self.handle_launcher_args(parse_launcher_args(argv))
+
+    def handle_launcher_args(self, args, raise_window=True):
+        if args.quit:
+            self.quitting = True
+            self.close()
+            QApplication.instance().quit()
+            return
+        if args.system:
+            names = [c["name"] for c in TAB_CONFIGS]
+            if args.system in names:
+                self.systems_combo.setCurrentIndex(names.index(args.system))
+        if raise_window:
+            if self.is_fullscreen:
+                self.showFullScreen()
+            else:
+                self.showNormal()
+            self.raise_()
+            self.activateWindow()
+            self.roms_list.setFocus()
+
+    def closeEvent(self, event):
+        if self.resident_server and not self.quitting:
+            # Stay resident with warm caches; the next invocation raises this window again
+            event.ignore()
+            self.hide()
+            return
+        self.stop_video_snap()
+        self.loader_pool.shutdown(wait=False)
+        self.grid_pool.shutdown(wait=False)
+        if self.thumbnails:
+            self.thumbnails.close()
+        if self.api_server:
+            self.api_server.stop()
+            self.api_server = None
+        if self.history:
+            self.history.close()
+        super().closeEvent(event)
+
     def poll_joystick(self):
         if not self.isActiveWindow() or not self.is_active:
             return
@@ -1076,12 +3645,23 @@ class MainWindow(QMainWindow):
             check_button("button_down", lambda: self.roms_list.setCurrentRow(min(self.roms_list.count() - 1, self.roms_list.currentRow() + 1)))
             check_button("button_select", self.launch_selected_rom)
             check_button("button_favorites", self.show_favorites)
+            check_button("button_history", self.show_history)
             check_button("button_prev_tab", lambda: self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() - 1) % self.systems_combo.count()))
             check_button("button_next_tab", lambda: self.systems_combo.setCurrentIndex((self.systems_combo.currentIndex() + 1) % self.systems_combo.count()))
+            check_button("button_toggle_clones", lambda: self.toggle_clones(self.roms_list.currentRow()))
+            check_button("button_prev_letter", lambda: self.jump_to_letter(-1))
+            check_button("button_next_letter", lambda: self.jump_to_letter(1))
             
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
+    if forward_to_resident_instance(sys.argv[1:]):
+        sys.exit(0)
+    args = parse_launcher_args(sys.argv[1:])
+    if args.quit:
+        sys.exit(0)
     win = MainWindow()
     win.resize(1100, 700)
+    win.handle_launcher_args(args, raise_window=False)
     win.show()
     sys.exit(app.exec_())
\ No newline at end of file